@@ -4,7 +4,7 @@ import { join } from 'path'
 
 export async function POST(request: NextRequest) {
   try {
-    const { clip_duration, cleanup_full_downloads, download_only_clip_duration } = await request.json()
+    const { clip_duration, cleanup_full_downloads, download_only_clip_duration, cache_playlists } = await request.json()
     
     // 클립 길이 유효성 검사 (최대 10초)
     const validClipDuration = Math.min(Math.max(clip_duration || 10, 3), 10)
@@ -16,7 +16,8 @@ export async function POST(request: NextRequest) {
       clip_duration: validClipDuration,
       clip_start_offset: 30, // 기본값 유지
       cleanup_full_downloads: cleanup_full_downloads !== false, // 기본값 true
-      download_only_clip_duration: download_only_clip_duration === true // 기본값 false
+      download_only_clip_duration: download_only_clip_duration === true, // 기본값 false
+      cache_playlists: cache_playlists === true // 기본값 false (1시간 동안 플레이리스트 목록 재사용)
     }
     
     await writeFile(settingsPath, JSON.stringify(settings, null, 2), 'utf-8')
@@ -54,7 +55,8 @@ export async function GET() {
         clip_duration: 10, // 최대 10초로 변경
         clip_start_offset: 30,
         cleanup_full_downloads: true,
-        download_only_clip_duration: false
+        download_only_clip_duration: false,
+        cache_playlists: false
       }
       return NextResponse.json({ success: true, settings: defaultSettings })
     }
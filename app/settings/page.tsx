@@ -40,6 +40,7 @@ export default function SettingsPage() {
   const [timerDuration, setTimerDuration] = useState([15]);
   const [cleanupFullDownloads, setCleanupFullDownloads] = useState(true);
   const [downloadOnlyClipDuration, setDownloadOnlyClipDuration] = useState(false);
+  const [cachePlaylists, setCachePlaylists] = useState(false);
   const [isSaving, setIsSaving] = useState(false);
 
   // 설정 로드
@@ -53,6 +54,7 @@ export default function SettingsPage() {
             setSnippetDuration([result.settings.clip_duration || 10]);
             setCleanupFullDownloads(result.settings.cleanup_full_downloads !== false);
             setDownloadOnlyClipDuration(result.settings.download_only_clip_duration === true);
+            setCachePlaylists(result.settings.cache_playlists === true);
           }
         }
       } catch (error) {
@@ -75,7 +77,8 @@ export default function SettingsPage() {
         body: JSON.stringify({
           clip_duration: snippetDuration[0],
           cleanup_full_downloads: cleanupFullDownloads,
-          download_only_clip_duration: downloadOnlyClipDuration
+          download_only_clip_duration: downloadOnlyClipDuration,
+          cache_playlists: cachePlaylists
         })
       });
 
@@ -194,6 +197,18 @@ export default function SettingsPage() {
                 </div>
                 <Switch checked={downloadOnlyClipDuration} onCheckedChange={setDownloadOnlyClipDuration} />
               </div>
+
+              <div className="flex items-center justify-between">
+                <div className="space-y-1">
+                  <Label className="text-base font-medium text-gray-900 dark:text-white">
+                    플레이리스트 목록 캐시
+                  </Label>
+                  <p className="text-xs sm:text-sm text-gray-600 dark:text-gray-400">
+                    같은 플레이리스트를 1시간 동안 다시 조회하지 않습니다 (그 사이 추가된 곡은 빠질 수 있음)
+                  </p>
+                </div>
+                <Switch checked={cachePlaylists} onCheckedChange={setCachePlaylists} />
+              </div>
             </CardContent>
           </Card>
 
@@ -5,18 +5,26 @@ YouTube 음악 다운로드 및 클립 생성 스크립트 (병렬 처리 최적
 """
 
 import os
+import queue
 import sys
 import json
+import asyncio
+import io
+import multiprocessing
 import re
 import subprocess
 import time
 import threading
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from urllib.parse import parse_qs, urlparse
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
+from dataclasses import dataclass, replace
+
+try:
+    import orjson  # 선택 사항: 설치되어 있으면 더 빠른 JSON 직렬화 사용
+except ImportError:
+    orjson = None
 
 # 성능 로깅 모듈 import
 from performance_logger import (
@@ -25,13 +33,20 @@ from performance_logger import (
     time_step,
     start_step_timing,
     end_step_timing,
-    finalize_performance_logging
+    finalize_performance_logging,
+    dumps_progress,
+    format_timestamp
 )
 
 try:
+    import aiohttp
+    import aiofiles
     from pydub import AudioSegment
-    from mutagen.mp3 import MP3
-    from mutagen.id3 import ID3NoHeaderError
+    from yt_dlp import YoutubeDL
+    from yt_dlp.utils import DownloadError
+    from mutagen import MutagenError
+    from mutagen.mp3 import MPEGInfo
+    from mutagen.id3 import ID3, ID3NoHeaderError, TIT2, TALB
 except ImportError:
     print("필요한 패키지를 설치하세요: pip install -r requirements.txt")
     sys.exit(1)
@@ -42,15 +57,30 @@ DOWNLOADS_DIR = PROJECT_ROOT / "public" / "downloads"
 CLIPS_DIR = PROJECT_ROOT / "public" / "clips" 
 DATA_DIR = PROJECT_ROOT / "public" / "data"
 QUIZ_JSON_PATH = DATA_DIR / "quiz.json"
+CLIP_CACHE_PATH = DATA_DIR / ".clip_cache.json"
+PLAYLIST_CACHE_PATH = DATA_DIR / ".playlist_cache.json"
+PLAYLIST_CACHE_TTL = 60 * 60  # 플레이리스트 확장 결과를 재사용할 시간 (초, 그 사이 추가된 곡은 반영되지 않음)
 
 # 병렬 처리 설정
 MAX_WORKERS = 3  # 동시 처리할 최대 작업 수
-PROGRESS_LOCK = threading.Lock()  # 진행률 업데이트 동기화
+CLIP_WORKERS = os.cpu_count() or 1  # 클립 생성에 사용할 최대 프로세스 수
+DOWNLOAD_CHUNK_SIZE = 1 << 16  # aiohttp 스트리밍 다운로드 청크 크기 (64KB)
+# 긴 곡이나 속도가 제한된 다운로드가 전체 시간 제한에 걸리지 않도록 읽기 대기 시간만 제한
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60)
+FRAGMENT_DOWNLOAD_WORKERS = 8  # 조각(HLS/DASH) 스트림을 yt-dlp로 받을 때 동시에 받을 조각 수
+DIRECT_DOWNLOAD_PROTOCOLS = {'http', 'https'}  # aiohttp로 한 번에 받을 수 있는 스트림 프로토콜
+AUDIO_ID_SEPARATOR = "___"  # 다운로드 파일명의 비디오 ID와 제목 구분자
+TRIMMED_AUDIO_SUFFIX = ".trimmed"  # 클립 구간만 받은 파일 표시 (전체 다운로드 파일과 경로가 겹치지 않도록)
+SPECIAL_CHARS_RE = re.compile(r'[^\w\s-]')  # 클립 파일명에서 치환할 특수문자
+SEPARATORS_RE = re.compile(r'[-\s]+')  # 클립 파일명에서 언더스코어로 합칠 공백/하이픈
+METADATA_FRAMES = {'TIT2': TIT2, 'TALB': TALB}  # 파싱할 ID3 프레임 (APIC 등 나머지는 해석하지 않음)
+PROGRESS_FLUSH_INTERVAL = 0.1  # 진행률 출력 스레드가 모아서 출력하는 간격 (초)
 
 # 전역 진행률 추적
 class ProgressTracker:
     def __init__(self):
-        self.completed_videos = []
+        # 완료 목록은 튜플로 교체만 하므로 조회 시 복사 없이 참조만 넘겨도 안전
+        self.completed_videos: Tuple[Dict[str, str], ...] = ()
         self.active_workers = {}
         self.lock = threading.Lock()
     
@@ -59,7 +89,7 @@ class ProgressTracker:
             video_info = {"title": title, "status": status}
             if error:
                 video_info["error"] = error
-            self.completed_videos.append(video_info)
+            self.completed_videos = self.completed_videos + (video_info,)
     
     def set_worker_status(self, worker_id: str, video_title: str, stage: str):
         with self.lock:
@@ -75,13 +105,94 @@ class ProgressTracker:
     def get_progress_data(self):
         with self.lock:
             return {
-                "completed_videos": self.completed_videos.copy(),
-                "active_workers": list(self.active_workers.values())
+                "completed_videos": self.completed_videos,
+                "active_workers": tuple(self.active_workers.values())
             }
 
 # 전역 진행률 추적기 인스턴스
 progress_tracker = ProgressTracker()
 
+# 진행률 출력 스레드
+class ProgressPrinter:
+    """작업 스레드는 큐에 넣기만 하고, JSON 직렬화와 stdout 출력은 전용 스레드에서 모아서 처리"""
+    
+    def __init__(self, flush_interval: float = PROGRESS_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self.queue = queue.Queue()
+        self.thread = None
+    
+    def start(self):
+        self.thread = threading.Thread(target=self._run, name="progress-printer", daemon=True)
+        self.thread.start()
+    
+    def emit(self, progress_info: Optional[Dict[str, Any]], message: Optional[str] = None):
+        """PROGRESS JSON 줄과 사람이 읽는 메시지 출력 요청 (타임스탬프는 요청 시각 기준)"""
+        item = (time.time(), progress_info, message)
+        if self.thread is None:
+            # 출력 스레드 없이 모듈을 직접 사용하는 경우 바로 출력
+            sys.stdout.write(self._format(item))
+        else:
+            self.queue.put_nowait(item)
+    
+    def flush(self):
+        """큐에 쌓인 출력이 모두 기록될 때까지 대기"""
+        if self.thread is not None:
+            self.queue.join()
+    
+    def stop(self):
+        if self.thread is not None:
+            self.queue.put_nowait(None)
+            self.thread.join()
+            self.thread = None
+    
+    def _format(self, item: Tuple[float, Optional[Dict[str, Any]], Optional[str]]) -> str:
+        timestamp, progress_info, message = item
+        text = ""
+        if progress_info is not None:
+            progress_info["timestamp"] = format_timestamp(timestamp)
+            text += f"PROGRESS: {dumps_progress(progress_info)}\n"
+        if message is not None:
+            text += f"{message}\n"
+        return text
+    
+    def _write(self, item: Tuple[float, Optional[Dict[str, Any]], Optional[str]]):
+        """항목 하나를 stdout 버퍼에 기록 (직렬화/인코딩에 실패한 항목은 기록 후 버림)"""
+        try:
+            sys.stdout.write(self._format(item))
+        except Exception as e:
+            # 잘못된 항목 하나 때문에 출력 스레드가 멈추면 이후 출력이 모두 막히므로 건너뜀
+            sys.stderr.write(f"진행률 항목 출력 실패 (건너뜀): {e!r}\n")
+    
+    def _run(self):
+        stopped = False
+        while not stopped:
+            # 첫 항목을 기다린 뒤 그 사이 쌓인 항목을 한 번에 출력
+            items = [self.queue.get()]
+            while True:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stopped = None in items
+            try:
+                for item in items:
+                    if item is not None:
+                        self._write(item)
+                sys.stdout.flush()
+            except Exception as e:
+                sys.stderr.write(f"진행률 출력 실패: {e!r}\n")
+            finally:
+                # 출력에 실패해도 flush()가 영원히 기다리지 않도록 꺼낸 항목은 모두 완료 처리
+                for _ in items:
+                    self.queue.task_done()
+            
+            if not stopped:
+                time.sleep(self.flush_interval)
+
+# 전역 진행률 출력기 인스턴스
+progress_printer = ProgressPrinter()
+
 @dataclass
 class ProcessingResult:
     """클립 처리 결과"""
@@ -101,22 +212,31 @@ def is_playlist_url(url: str) -> bool:
     """플레이리스트 URL인지 확인"""
     return 'playlist?list=' in url
 
+def emit_playlist_extracted(video_count: int):
+    """플레이리스트 확장 결과 진행률 출력 (API가 예상 총 곡 수를 설정하는 데 사용)"""
+    progress_info = {
+        "type": "playlist_extracted",
+        "total_videos": video_count,
+        "message": f"플레이리스트에서 {video_count}개 비디오를 발견했습니다"
+    }
+    progress_printer.emit(progress_info)
+
 def extract_playlist_urls(playlist_url: str) -> List[str]:
     """플레이리스트에서 개별 비디오 URL들 추출"""
     try:
-        cmd = [
-            'yt-dlp',
-            '--flat-playlist',
-            '--get-id',
-            '--no-warnings',
-            playlist_url
-        ]
+        ydl_opts = {
+            'extract_flat': 'in_playlist',  # 개별 영상 정보는 가져오지 않고 ID만 추출
+            'quiet': True,
+            'no_warnings': True
+        }
         
         print(f"플레이리스트 추출 시작: {playlist_url}")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        # 플레이리스트마다 전용 인스턴스를 사용하여 여러 플레이리스트를 동시에 확장
+        with YoutubeDL(ydl_opts) as ydl:
+            playlist_info = ydl.extract_info(playlist_url, download=False)
         
-        # 출력 정리 및 빈 줄 제거
-        video_ids = [line.strip() for line in result.stdout.strip().split('\n') if line.strip()]
+        # 빈 항목 제거
+        video_ids = [entry.get('id') for entry in playlist_info.get('entries') or [] if entry]
         
         # 유효한 YouTube 비디오 ID만 필터링 (11자리 문자열)
         valid_ids = [vid for vid in video_ids if vid and len(vid) == 11 and vid.isalnum()]
@@ -124,309 +244,533 @@ def extract_playlist_urls(playlist_url: str) -> List[str]:
         urls = [f"https://www.youtube.com/watch?v={vid}" for vid in valid_ids]
         
         print(f"플레이리스트에서 {len(urls)}개 유효한 비디오 발견")
-        
-        # 진행률 정보 출력
-        progress_info = {
-            "type": "playlist_extracted",
-            "total_videos": len(urls),
-            "message": f"플레이리스트에서 {len(urls)}개 비디오를 발견했습니다",
-            "timestamp": datetime.now().isoformat()
-        }
-        print(f"PROGRESS: {json.dumps(progress_info, ensure_ascii=False)}")
+        emit_playlist_extracted(len(urls))
         
         return urls
-    except subprocess.CalledProcessError as e:
+    except DownloadError as e:
         print(f"플레이리스트 추출 실패: {e}")
         error_info = {
             "type": "playlist_error",
-            "message": f"플레이리스트 추출 실패: {str(e)}",
-            "timestamp": datetime.now().isoformat()
+            "message": f"플레이리스트 추출 실패: {str(e)}"
         }
-        print(f"PROGRESS: {json.dumps(error_info, ensure_ascii=False)}")
+        progress_printer.emit(error_info)
         return []
 
-def process_single_url(url: str, index: int, total: int, user_settings: Dict[str, Any], start_time: float) -> ProcessingResult:
-    """단일 URL을 처리하여 클립 생성 (병렬 처리용 + 성능 로깅)"""
-    processing_start = time.time()
+def extract_playlist_id(url: str) -> Optional[str]:
+    """플레이리스트 URL에서 플레이리스트 ID 추출"""
+    return parse_qs(urlparse(url).query).get('list', [None])[0]
+
+async def expand_playlist_urls(urls: List[str], playlist_cache: Optional[Dict[str, Dict[str, Any]]] = None) -> List[str]:
+    """플레이리스트 URL들을 asyncio TaskGroup으로 동시에 확장 (입력 순서 유지, playlist_cache가 주어지면 최근 확장 결과 재사용)"""
+    expanded: List[Any] = []
+    now = time.time()
+    
+    async with asyncio.TaskGroup() as tg:
+        for i, url in enumerate(urls, 1):
+            if is_playlist_url(url):
+                playlist_id = extract_playlist_id(url)
+                entry = playlist_cache.get(playlist_id) if playlist_cache is not None and playlist_id else None
+                if entry and now - entry['fetched_at'] < PLAYLIST_CACHE_TTL:
+                    print(f"캐시된 플레이리스트 사용: {url} ({len(entry['urls'])}개 비디오)")
+                    emit_playlist_extracted(len(entry['urls']))
+                    expanded.append(entry['urls'])
+                    continue
+                
+                progress_info = {
+                    "type": "playlist_processing",
+                    "current_playlist": i,
+                    "total_playlists": len(urls),
+                    "message": f"플레이리스트 {i}/{len(urls)} 처리 중..."
+                }
+                progress_printer.emit(progress_info)
+                
+                expanded.append(tg.create_task(asyncio.to_thread(extract_playlist_urls, url)))
+            else:
+                expanded.append(url)
+    
+    expanded_urls = []
+    for url, item in zip(urls, expanded):
+        if isinstance(item, str):
+            expanded_urls.append(item)
+            continue
+        
+        if isinstance(item, asyncio.Task):
+            individual_urls = item.result()
+            playlist_id = extract_playlist_id(url)
+            # 추출 실패(빈 목록)는 다음 실행에서 다시 시도하도록 캐시하지 않음
+            if playlist_cache is not None and playlist_id and individual_urls:
+                playlist_cache[playlist_id] = {'urls': individual_urls, 'fetched_at': now}
+        else:
+            individual_urls = item
+        expanded_urls.extend(individual_urls)
+    
+    return expanded_urls
+
+async def process_single_url(url: str, index: int, total: int, audio_path: Optional[str], user_settings: Dict[str, Any], start_time: float, processing_start: float, clip_pool: ProcessPoolExecutor) -> ProcessingResult:
+    """배치 다운로드된 단일 URL을 후처리하여 클립 생성 (비동기 병렬 처리용 + 성능 로깅)"""
     song_title = f"곡 {index}/{total}"  # 초기 제목
-    worker_id = f"worker_{threading.current_thread().ident}_{index}"
+    worker_id = f"worker_{index}"
     
     try:
-        # 1. 오디오 다운로드
-        progress_tracker.set_worker_status(worker_id, song_title, "다운로드 중")
-        with PROGRESS_LOCK:
-            print_enhanced_progress(index, total, "다운로드 중", song_title, start_time)
-        
-        download_step_id = start_step_timing("Audio Download", "download", song_title, {"url": url, "index": index})
-        
-        try:
-            audio_path = download_audio(url, user_settings)
-            if not audio_path:
-                end_step_timing(download_step_id, False, "다운로드 실패")
-                progress_tracker.add_completed_video(song_title, "failed", "다운로드 실패")
-                progress_tracker.remove_worker(worker_id)
-                return ProcessingResult(
-                    success=False,
-                    url=url,
-                    error="다운로드 실패",
-                    processing_time=time.time() - processing_start
-                )
-            end_step_timing(download_step_id, True, None, {"audio_path": audio_path})
-        except Exception as e:
-            end_step_timing(download_step_id, False, str(e))
-            progress_tracker.add_completed_video(song_title, "failed", str(e))
-            progress_tracker.remove_worker(worker_id)
-            raise
-        
-        # 2. 메타데이터 추출
-        progress_tracker.set_worker_status(worker_id, song_title, "메타데이터 추출 중")
-        metadata_step_id = start_step_timing("Metadata Extraction", "metadata_extraction", song_title, {"audio_path": audio_path})
-        
-        try:
-            metadata = extract_metadata(audio_path)
-            song_title = metadata['title']  # 실제 제목으로 업데이트
-            progress_tracker.set_worker_status(worker_id, song_title, "메타데이터 추출 중")
-            end_step_timing(metadata_step_id, True, None, {"extracted_title": song_title})
-        except Exception as e:
-            end_step_timing(metadata_step_id, False, str(e))
-            metadata = {'title': f'Unknown_{index}', 'album': 'Unknown'}
-            song_title = metadata['title']
-            progress_tracker.set_worker_status(worker_id, song_title, "메타데이터 추출 중")
-        
-        with PROGRESS_LOCK:
-            print_enhanced_progress(index, total, "메타데이터 추출 중", song_title, start_time)
-        
-        # 3. 오디오 길이 확인
-        progress_tracker.set_worker_status(worker_id, song_title, "오디오 분석 중")
-        audio_analysis_step_id = start_step_timing("Audio Analysis", "metadata_extraction", song_title, {"audio_path": audio_path})
-        
-        try:
-            audio = AudioSegment.from_mp3(audio_path)
-            duration_seconds = len(audio) // 1000
-            end_step_timing(audio_analysis_step_id, True, None, {"duration": duration_seconds})
-        except Exception as e:
-            end_step_timing(audio_analysis_step_id, False, str(e))
-            progress_tracker.add_completed_video(song_title, "failed", f"오디오 파일 읽기 실패: {str(e)}")
+        # 1. 배치 다운로드 결과 확인
+        if not audio_path:
+            progress_tracker.add_completed_video(song_title, "failed", "다운로드 실패")
             progress_tracker.remove_worker(worker_id)
-            if user_settings.get('cleanup_full_downloads', True):
-                cleanup_full_download(audio_path)
             return ProcessingResult(
                 success=False,
                 url=url,
-                error=f"오디오 파일 읽기 실패: {str(e)}",
+                error="다운로드 실패",
                 processing_time=time.time() - processing_start
             )
         
-        # 4. 클립 생성
-        progress_tracker.set_worker_status(worker_id, song_title, "클립 생성 중")
-        with PROGRESS_LOCK:
-            print_enhanced_progress(index, total, "클립 생성 중", song_title, start_time)
-        
-        clip_generation_step_id = start_step_timing("Clip Generation", "clip_generation", song_title, {
-            "duration": duration_seconds,
-            "clip_start_offset": user_settings['clip_start_offset'],
-            "clip_duration": user_settings['clip_duration']
-        })
-        
-        try:
-            clip_start = min(user_settings['clip_start_offset'], max(0, duration_seconds - user_settings['clip_duration'] - 5))
-            clip_path = create_clip(audio_path, clip_start, user_settings['clip_duration'])
-            
-            if not clip_path:
-                end_step_timing(clip_generation_step_id, False, "클립 생성 실패")
-                progress_tracker.add_completed_video(song_title, "failed", "클립 생성 실패")
-                progress_tracker.remove_worker(worker_id)
-                if user_settings.get('cleanup_full_downloads', True):
-                    cleanup_full_download(audio_path)
-                return ProcessingResult(
-                    success=False,
-                    url=url,
-                    error="클립 생성 실패",
-                    processing_time=time.time() - processing_start
-                )
-            
-            end_step_timing(clip_generation_step_id, True, None, {
-                "clip_path": clip_path,
-                "clip_start": clip_start,
-                "clip_duration": user_settings['clip_duration']
-            })
-        except Exception as e:
-            end_step_timing(clip_generation_step_id, False, str(e))
-            progress_tracker.add_completed_video(song_title, "failed", str(e))
-            progress_tracker.remove_worker(worker_id)
-            raise
-        
-        # 5. 전체 파일 정리 (설정에 따라)
-        progress_tracker.set_worker_status(worker_id, song_title, "파일 정리 중")
-        full_path_for_data = audio_path
-        if user_settings.get('cleanup_full_downloads', True):
-            with PROGRESS_LOCK:
-                print_enhanced_progress(index, total, "파일 정리 중", song_title, start_time)
-            
-            cleanup_step_id = start_step_timing("File Cleanup", "file_cleanup", song_title, {"audio_path": audio_path})
-            
-            try:
-                cleanup_full_download(audio_path)
-                full_path_for_data = None
-                end_step_timing(cleanup_step_id, True, None, {"cleaned_up": True})
-            except Exception as e:
-                end_step_timing(cleanup_step_id, False, str(e))
-                # 정리 실패는 치명적이지 않으므로 계속 진행
-        
-        # 6. 데이터 준비
-        song_data = {
-            'title': metadata['title'],
-            'album': metadata['album'],
-            'audio_path': full_path_for_data,
-            'clip_path': clip_path,
-            'duration': duration_seconds,
-            'clip_start': clip_start,
-            'clip_duration': user_settings['clip_duration']
-        }
+        # 2~6. 메타데이터/클립 생성 등 블로킹 작업은 스레드 풀에서 실행
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, process_downloaded_audio,
+            url, audio_path, index, total, user_settings, start_time, processing_start, worker_id, song_title, clip_pool
+        )
         
-        progress_tracker.add_completed_video(song_title, "success")
+    except Exception as e:
+        progress_tracker.add_completed_video(song_title, "failed", f"예상치 못한 오류: {str(e)}")
         progress_tracker.remove_worker(worker_id)
-        
-        with PROGRESS_LOCK:
-            print_enhanced_progress(index, total, "완료", song_title, start_time)
-        
         return ProcessingResult(
-            success=True,
+            success=False,
             url=url,
-            song_data=song_data,
+            error=f"예상치 못한 오류: {str(e)}",
             processing_time=time.time() - processing_start
         )
-        
+
+def process_downloaded_audio(url: str, audio_path: str, index: int, total: int, user_settings: Dict[str, Any], start_time: float, processing_start: float, worker_id: str, song_title: str, clip_pool: ProcessPoolExecutor) -> ProcessingResult:
+    """다운로드된 오디오의 후처리 (메타데이터 추출, 클립 생성, 정리)"""
+    # 2. 메타데이터 추출
+    progress_tracker.set_worker_status(worker_id, song_title, "메타데이터 추출 중")
+    metadata_step_id = start_step_timing("Metadata Extraction", "metadata_extraction", song_title, {"audio_path": audio_path})
+    
+    try:
+        metadata = extract_metadata(audio_path)
+        song_title = metadata['title']  # 실제 제목으로 업데이트
+        progress_tracker.set_worker_status(worker_id, song_title, "메타데이터 추출 중")
+        end_step_timing(metadata_step_id, True, None, {"extracted_title": song_title})
     except Exception as e:
-        progress_tracker.add_completed_video(song_title, "failed", f"예상치 못한 오류: {str(e)}")
+        end_step_timing(metadata_step_id, False, str(e))
+        metadata = {'title': f'Unknown_{index}', 'album': 'Unknown'}
+        song_title = metadata['title']
+        progress_tracker.set_worker_status(worker_id, song_title, "메타데이터 추출 중")
+    
+    print_enhanced_progress(index, total, "메타데이터 추출 중", song_title, start_time)
+    
+    # 3. 오디오 길이 확인
+    progress_tracker.set_worker_status(worker_id, song_title, "오디오 분석 중")
+    audio_analysis_step_id = start_step_timing("Audio Analysis", "metadata_extraction", song_title, {"audio_path": audio_path})
+    
+    try:
+        # 메타데이터 추출 시 MP3 헤더에서 읽은 길이를 사용하고, 없을 때만 ffprobe 실행
+        duration_seconds = metadata.get('duration')
+        if duration_seconds is None:
+            duration_seconds = get_audio_duration(audio_path)
+        end_step_timing(audio_analysis_step_id, True, None, {"duration": duration_seconds})
+    except Exception as e:
+        end_step_timing(audio_analysis_step_id, False, str(e))
+        progress_tracker.add_completed_video(song_title, "failed", f"오디오 파일 읽기 실패: {str(e)}")
         progress_tracker.remove_worker(worker_id)
+        if user_settings.get('cleanup_full_downloads', True):
+            cleanup_full_download(audio_path)
         return ProcessingResult(
             success=False,
             url=url,
-            error=f"예상치 못한 오류: {str(e)}",
+            error=f"오디오 파일 읽기 실패: {str(e)}",
             processing_time=time.time() - processing_start
         )
-
-def download_audio(url: str, user_settings: Dict[str, Any] = None) -> str:
-    """YouTube에서 오디오 다운로드"""
-    if user_settings is None:
-        user_settings = get_user_settings()
-        
+    
+    # 4. 클립 생성
+    progress_tracker.set_worker_status(worker_id, song_title, "클립 생성 중")
+    print_enhanced_progress(index, total, "클립 생성 중", song_title, start_time)
+    
+    clip_generation_step_id = start_step_timing("Clip Generation", "clip_generation", song_title, {
+        "duration": duration_seconds,
+        "clip_start_offset": user_settings['clip_start_offset'],
+        "clip_duration": user_settings['clip_duration']
+    })
+    
     try:
-        # 파일명에서 특수문자 제거를 위한 템플릿 설정
-        output_template = str(DOWNLOADS_DIR / "%(title)s.%(ext)s")
+        clip_start = min(user_settings['clip_start_offset'], max(0, duration_seconds - user_settings['clip_duration'] - 5))
+        # 클립 생성은 별도 프로세스 풀에서 실행하여 코어 수만큼 동시에 처리
+        clip_job = (audio_path, clip_start, user_settings['clip_duration'], duration_seconds)
+        clip_path = clip_pool.submit(create_clip_worker, clip_job).result()
         
-        cmd = [
-            'yt-dlp',
-            '-x',  # 오디오만 추출
-            '--audio-format', 'mp3',  # MP3로 변환
-            '--audio-quality', '0',   # 최고 품질
-            '-o', output_template,    # 출력 경로
-            '--no-playlist',          # 플레이리스트 무시
-        ]
+        if not clip_path:
+            end_step_timing(clip_generation_step_id, False, "클립 생성 실패")
+            progress_tracker.add_completed_video(song_title, "failed", "클립 생성 실패")
+            progress_tracker.remove_worker(worker_id)
+            if user_settings.get('cleanup_full_downloads', True):
+                cleanup_full_download(audio_path)
+            return ProcessingResult(
+                success=False,
+                url=url,
+                error="클립 생성 실패",
+                processing_time=time.time() - processing_start
+            )
         
-        # 클립 길이만 다운로드 하는 경우
-        if user_settings.get('download_only_clip_duration', False):
-            start_time = user_settings.get('clip_start_offset', 30)
-            duration = user_settings.get('clip_duration', 10)
-            # 약간의 여유를 두어 다운로드 (편집을 위해)
-            cmd.extend([
-                '--external-downloader', 'ffmpeg',
-                '--external-downloader-args', 
-                f'ffmpeg_i:-ss {start_time} -t {duration + 5}'
-            ])
-        
-        cmd.append(url)
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        
-        # 다운로드된 파일 경로 찾기
-        for line in result.stdout.split('\n'):
-            if 'Destination:' in line or '[ExtractAudio]' in line:
-                # 파일 경로 추출
-                for file in DOWNLOADS_DIR.glob("*.mp3"):
-                    if file.stat().st_mtime > (subprocess.PIPE):  # 최근 생성된 파일
-                        return str(file)
-        
-        # 가장 최근 mp3 파일 반환
-        mp3_files = list(DOWNLOADS_DIR.glob("*.mp3"))
-        if mp3_files:
-            return str(max(mp3_files, key=lambda x: x.stat().st_mtime))
-            
-    except subprocess.CalledProcessError as e:
-        print(f"다운로드 실패 {url}: {e}")
+        end_step_timing(clip_generation_step_id, True, None, {
+            "clip_path": clip_path,
+            "clip_start": clip_start,
+            "clip_duration": user_settings['clip_duration']
+        })
+    except Exception as e:
+        end_step_timing(clip_generation_step_id, False, str(e))
+        progress_tracker.add_completed_video(song_title, "failed", str(e))
+        progress_tracker.remove_worker(worker_id)
+        raise
+    
+    # 5. 전체 파일 정리 (설정에 따라)
+    progress_tracker.set_worker_status(worker_id, song_title, "파일 정리 중")
+    full_path_for_data = audio_path
+    if user_settings.get('cleanup_full_downloads', True):
+        print_enhanced_progress(index, total, "파일 정리 중", song_title, start_time)
         
+        cleanup_step_id = start_step_timing("File Cleanup", "file_cleanup", song_title, {"audio_path": audio_path})
+        
+        try:
+            cleanup_full_download(audio_path)
+            full_path_for_data = None
+            end_step_timing(cleanup_step_id, True, None, {"cleaned_up": True})
+        except Exception as e:
+            end_step_timing(cleanup_step_id, False, str(e))
+            # 정리 실패는 치명적이지 않으므로 계속 진행
+    
+    # 6. 데이터 준비
+    song_data = {
+        'title': metadata['title'],
+        'album': metadata['album'],
+        'audio_path': full_path_for_data,
+        'clip_path': clip_path,
+        'duration': duration_seconds,
+        'clip_start': clip_start,
+        'clip_duration': user_settings['clip_duration']
+    }
+    
+    progress_tracker.add_completed_video(song_title, "success")
+    progress_tracker.remove_worker(worker_id)
+    
+    print_enhanced_progress(index, total, "완료", song_title, start_time)
+    
+    return ProcessingResult(
+        success=True,
+        url=url,
+        song_data=song_data,
+        processing_time=time.time() - processing_start
+    )
+
+def extract_video_id(url: str) -> Optional[str]:
+    """YouTube URL에서 비디오 ID 추출"""
+    parsed = urlparse(url)
+    
+    # 단축 URL (https://youtu.be/<id>)
+    if parsed.hostname and parsed.hostname.endswith('youtu.be'):
+        return parsed.path.strip('/').split('/')[0] or None
+    
+    # 일반 URL (https://www.youtube.com/watch?v=<id>)
+    video_ids = parse_qs(parsed.query).get('v')
+    if video_ids:
+        return video_ids[0]
+    
+    # shorts/embed/live URL (https://www.youtube.com/shorts/<id>)
+    path_parts = parsed.path.strip('/').split('/')
+    if len(path_parts) >= 2 and path_parts[0] in ('shorts', 'embed', 'live'):
+        return path_parts[1]
+    
     return None
 
+def get_audio_title(audio_path: str) -> str:
+    """다운로드 파일명에서 비디오 ID 접두사를 제거한 원본 제목 반환"""
+    stem = Path(audio_path).stem.removesuffix(TRIMMED_AUDIO_SUFFIX)
+    _, separator, title = stem.partition(AUDIO_ID_SEPARATOR)
+    return title if separator else stem
+
+def is_trimmed_audio(audio_path: str) -> bool:
+    """클립 구간만 받은 파일인지 확인"""
+    return Path(audio_path).stem.endswith(TRIMMED_AUDIO_SUFFIX)
+
+def build_download_options() -> Dict[str, Any]:
+    """yt-dlp 스트림 URL 조회 옵션 생성 (다운로드는 aiohttp로 직접 수행)"""
+    # 비디오 ID를 파일명 앞에 붙여 같은 제목의 영상끼리 충돌하지 않도록 함
+    output_template = str(DOWNLOADS_DIR / f"%(id)s{AUDIO_ID_SEPARATOR}%(title)s.%(ext)s")
+    
+    return {
+        'format': 'bestaudio/best',
+        'outtmpl': output_template,  # 출력 경로
+        'noplaylist': True,  # 플레이리스트 무시
+        'concurrent_fragment_downloads': FRAGMENT_DOWNLOAD_WORKERS,  # 조각 스트림은 병렬로 다운로드
+        'quiet': True,
+        'noprogress': True,
+        'no_warnings': True
+    }
+
+def resolve_stream(ydl: YoutubeDL, url: str) -> Tuple[Dict[str, Any], str]:
+    """청크의 YoutubeDL 인스턴스로 스트림 정보와 저장할 파일명 조회"""
+    info = ydl.extract_info(url, download=False)
+    return info, ydl.prepare_filename(info)
+
+async def download_stream(session: aiohttp.ClientSession, info: Dict[str, Any], source_path: str):
+    """yt-dlp가 조회한 미디어 URL을 aiohttp로 스트리밍하여 파일로 저장 (http_chunk_size가 있으면 yt-dlp처럼 Range 구간 단위로 요청)"""
+    headers = dict(info.get('http_headers') or {})
+    # googlevideo는 Range 없는 요청의 속도를 제한하므로 yt-dlp가 지정한 구간 크기를 따름
+    range_size = (info.get('downloader_options') or {}).get('http_chunk_size')
+    
+    async with aiofiles.open(source_path, 'wb') as f:
+        position = 0
+        while True:
+            if range_size:
+                headers['Range'] = f"bytes={position}-{position + range_size - 1}"
+            
+            received = 0
+            async with session.get(info['url'], headers=headers) as response:
+                response.raise_for_status()
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    await f.write(chunk)
+                    received += len(chunk)
+                
+                # 구간 요청이 아니거나 서버가 Range를 무시하고 전체를 보낸 경우 한 번으로 끝
+                if not range_size or response.status != 206:
+                    return
+                
+                # Content-Range: bytes 시작-끝/전체 크기
+                total_size = response.headers.get('Content-Range', '').rpartition('/')[2]
+            
+            position += received
+            if received < range_size or (total_size.isdigit() and position >= int(total_size)):
+                return
+
+def download_fragmented_stream(info: Dict[str, Any], source_path: str):
+    """HLS/DASH처럼 조각으로 나뉜 스트림을 yt-dlp 다운로더로 조각 병렬 다운로드 (청크의 조회 인스턴스와 동시에 쓰지 않도록 전용 인스턴스 사용)"""
+    with YoutubeDL(build_download_options()) as ydl:
+        if not ydl.dl(source_path, info):
+            raise OSError(f"조각 스트림 다운로드 실패: {info.get('webpage_url', info['id'])}")
+
+def convert_to_mp3(source_path: str, mp3_path: str) -> str:
+    """다운로드한 원본 오디오를 MP3로 변환 후 원본 삭제 (프로세스 풀용)"""
+    cmd = [
+        'ffmpeg', '-y', '-loglevel', 'error',
+        '-i', source_path,
+        '-vn',
+        '-acodec', 'libmp3lame',
+        '-q:a', '0',  # 최고 품질 VBR
+        mp3_path
+    ]
+    subprocess.run(cmd, capture_output=True, check=True)
+    
+    os.remove(source_path)
+    return mp3_path
+
+def cut_stream_to_mp3(info: Dict[str, Any], mp3_path: str, trim: Tuple[int, int]) -> str:
+    """스트림 URL을 ffmpeg에 직접 전달해 필요한 구간만 받아 MP3로 변환 (전체 파일을 받지 않음, 네트워크 대기가 길어 스레드에서 실행)"""
+    cmd = ['ffmpeg', '-y', '-loglevel', 'error']
+    headers = info.get('http_headers')
+    if headers:
+        cmd.extend(['-headers', ''.join(f"{key}: {value}\r\n" for key, value in headers.items())])
+    # -i 앞의 -ss는 HTTP Range 요청으로 시작 지점까지 바로 탐색
+    cmd.extend([
+        '-ss', str(trim[0]),
+        '-t', str(trim[1]),
+        '-i', info['url'],
+        '-vn',
+        '-acodec', 'libmp3lame',
+        '-q:a', '0',
+        mp3_path
+    ])
+    subprocess.run(cmd, capture_output=True, check=True)
+    return mp3_path
+
+async def download_audio_batch(urls: List[str], session: aiohttp.ClientSession, convert_pool: ProcessPoolExecutor, download_limit: asyncio.Semaphore, user_settings: Dict[str, Any] = None) -> AsyncIterator[Tuple[str, str]]:
+    """여러 URL의 스트림 주소를 하나의 YoutubeDL 인스턴스로 조회하고 aiohttp로 동시에 다운로드하며 완료된 순서대로 (입력 URL, MP3 경로) 반환 (download_limit: 청크 간에 공유하는 동시 다운로드 제한)"""
+    if user_settings is None:
+        user_settings = get_user_settings()
+    
+    # 클립 길이만 다운로드 하는 경우 MP3 변환 시 필요한 구간만 남김 (편집을 위해 약간의 여유 포함)
+    trim = None
+    if user_settings.get('download_only_clip_duration', False):
+        trim = (user_settings.get('clip_start_offset', 30), user_settings.get('clip_duration', 10) + 5)
+    
+    loop = asyncio.get_running_loop()
+    # 다운로드 완료 항목 (입력 URL, MP3 경로), 종료 신호는 None
+    downloaded_q: asyncio.Queue = asyncio.Queue()
+    # 같은 영상을 가리키는 여러 URL은 한 번만 다운로드 (비디오 ID -> 결과를 받을 입력 URL 목록 / MP3 경로)
+    waiting_urls: Dict[str, List[str]] = {}
+    finished_paths: Dict[str, str] = {}
+    
+    async def download_one(info: Dict[str, Any], filename: str):
+        # 원본은 임시 확장자로 받아 원본 포맷이 MP3여도 변환 결과와 경로가 겹치지 않도록 함
+        source_path = f"{filename}.download"
+        # 구간만 받은 파일은 전체 다운로드 파일로 오인되거나 덮어쓰지 않도록 별도 이름 사용
+        mp3_suffix = f"{TRIMMED_AUDIO_SUFFIX}.mp3" if trim is not None else '.mp3'
+        mp3_path = str(Path(filename).with_suffix(mp3_suffix))
+        download_step_id = None
+        try:
+            # 스트림을 받는 동안만 제한을 잡고, MP3 변환은 프로세스 풀 크기로 제한
+            async with download_limit:
+                # 곡별 다운로드 시간 측정 (동시 다운로드 제한 대기 시간은 제외)
+                download_step_id = start_step_timing("Audio Download", "download", info.get('title', info['id']), {"url": info.get('webpage_url'), "video_id": info['id']})
+                if trim is not None:
+                    # 구간만 필요하면 원본 전체를 내려받지 않고 ffmpeg가 스트림에서 바로 잘라냄
+                    # 네트워크를 기다리는 작업이므로 CPU 수만큼인 프로세스 풀 대신 기본 스레드 풀에서 ffmpeg 대기
+                    await loop.run_in_executor(None, cut_stream_to_mp3, info, mp3_path, trim)
+                elif info.get('protocol', 'https') in DIRECT_DOWNLOAD_PROTOCOLS:
+                    await download_stream(session, info, source_path)
+                else:
+                    await loop.run_in_executor(None, download_fragmented_stream, info, source_path)
+            if trim is None:
+                await loop.run_in_executor(convert_pool, convert_to_mp3, source_path, mp3_path)
+            end_step_timing(download_step_id, True, None, {"mp3_path": mp3_path})
+            finished_paths[info['id']] = mp3_path
+            for url in waiting_urls.pop(info['id']):
+                await downloaded_q.put((url, mp3_path))
+        except (aiohttp.ClientError, OSError, subprocess.CalledProcessError, DownloadError) as e:
+            print(f"다운로드 실패 {info.get('webpage_url', info['id'])}: {e}")
+            end_step_timing(download_step_id, False, str(e))
+            waiting_urls.pop(info['id'], None)
+            cleanup_full_download(source_path)
+    
+    async def resolve_all():
+        # 스트림 URL 조회는 순서대로, 바이트 다운로드와 변환은 조회가 끝나는 대로 동시에 실행
+        try:
+            async with asyncio.TaskGroup() as downloads:
+                for url in urls:
+                    try:
+                        info, filename = await loop.run_in_executor(None, resolve_stream, ydl, url)
+                    except DownloadError as e:
+                        print(f"다운로드 실패 {url}: {e}")
+                        continue
+                    
+                    if not info.get('url'):
+                        print(f"다운로드 실패 {url}: 스트림 URL을 찾을 수 없습니다")
+                        continue
+                    
+                    video_id = info['id']
+                    if video_id in finished_paths:
+                        await downloaded_q.put((url, finished_paths[video_id]))
+                    elif video_id in waiting_urls:
+                        waiting_urls[video_id].append(url)
+                    else:
+                        waiting_urls[video_id] = [url]
+                        downloads.create_task(download_one(info, filename))
+        finally:
+            # 예외가 발생해도 소비자가 멈추지 않도록 항상 종료 신호 전달
+            await downloaded_q.put(None)
+    
+    # 청크마다 하나의 인스턴스를 재사용하여 쿠키/연결/추출기 캐시를 URL 간에 공유 (청크끼리는 병렬로 조회)
+    with YoutubeDL(build_download_options()) as ydl:
+        resolver = asyncio.create_task(resolve_all())
+        while (downloaded := await downloaded_q.get()) is not None:
+            yield downloaded
+        await resolver
+
 def cleanup_full_download(audio_path: str):
     """전체 다운로드 파일 삭제"""
     try:
-        if os.path.exists(audio_path):
-            os.remove(audio_path)
-            print(f"전체 파일 삭제됨: {audio_path}")
-    except Exception as e:
+        os.unlink(audio_path)
+        print(f"전체 파일 삭제됨: {audio_path}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
         print(f"파일 삭제 실패 {audio_path}: {e}")
 
 def clean_filename(filename: str) -> str:
     """파일명에서 특수문자 제거"""
     # 특수문자를 언더스코어로 치환
-    clean = re.sub(r'[^\w\s-]', '_', filename)
+    clean = SPECIAL_CHARS_RE.sub('_', filename)
     # 공백을 언더스코어로 치환
-    clean = re.sub(r'[-\s]+', '_', clean)
+    clean = SEPARATORS_RE.sub('_', clean)
     return clean.strip('_').lower()
 
 def extract_metadata(audio_path: str) -> Dict[str, Any]:
-    """오디오 파일에서 메타데이터 추출 (원본 YouTube 제목 사용)"""
+    """오디오 파일에서 메타데이터와 길이 추출 (원본 YouTube 제목 사용, 필요한 ID3 프레임과 MP3 헤더만 읽음)"""
     try:
-        audio = MP3(audio_path)
+        with open(audio_path, 'rb') as f:
+            try:
+                tags = ID3(f, known_frames=METADATA_FRAMES, translate=False)
+            except ID3NoHeaderError:
+                tags = None
+            
+            # ID3 태그 블록은 건너뛰고 첫 MPEG 프레임 헤더에서 길이 계산
+            duration = int(MPEGInfo(f).length)
         
-        title = str(audio.get('TIT2', ['Unknown'])[0]) if audio.get('TIT2') else "Unknown"
-        album = str(audio.get('TALB', ['Unknown'])[0]) if audio.get('TALB') else "Unknown"
+        title = str(tags['TIT2'].text[0]) if tags and 'TIT2' in tags else "Unknown"
+        album = str(tags['TALB'].text[0]) if tags and 'TALB' in tags else "Unknown"
         
         # 파일명에서 정보 추출 (메타데이터가 없는 경우 - 원본 제목 사용)
         if title == "Unknown":
-            title = Path(audio_path).stem  # 원본 YouTube 제목 그대로 사용
+            title = get_audio_title(audio_path)  # 원본 YouTube 제목 그대로 사용
         
         return {
             'title': title,
-            'album': album
+            'album': album,
+            'duration': duration
         }
-    except (ID3NoHeaderError, Exception):
-        # 메타데이터 없는 경우 파일명을 원본 제목으로 사용
-        basename = Path(audio_path).stem
+    except (MutagenError, OSError):
+        # MP3로 읽을 수 없는 경우 파일명을 원본 제목으로 사용
+        basename = get_audio_title(audio_path)
         return {
             'title': basename,  # 원본 YouTube 제목 그대로 사용
-            'album': 'Unknown'
+            'album': 'Unknown',
+            'duration': None
         }
 
-def create_clip(audio_path: str, start_time: int = 30, duration: int = 15, clip_duration: int = None) -> str:
-    """오디오 클립 생성 (사용자 설정에 따른 길이)"""
+def get_audio_duration(audio_path: str) -> int:
+    """ffprobe로 오디오 길이(초) 확인 (전체 디코딩 없이 컨테이너 정보만 읽음)"""
+    cmd = [
+        'ffprobe',
+        '-v', 'quiet',
+        '-show_entries', 'format=duration',
+        '-of', 'csv=p=0',
+        audio_path
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    return int(float(result.stdout.strip()))
+
+def export_clip_reencoded(audio_path: str, clip_path: Path, start_time: int, duration: int):
+    """필요한 구간만 디코딩하여 메모리 버퍼에 MP3로 인코딩한 뒤 한 번에 저장"""
+    clip = AudioSegment.from_file(audio_path, start_second=start_time, duration=duration)
+    
+    buffer = io.BytesIO()
+    clip.export(buffer, format="mp3", parameters=['-q:a', '0'])
+    clip_path.write_bytes(buffer.getvalue())
+
+def create_clip(audio_path: str, start_time: int = 30, duration: int = 15, clip_duration: int = None, audio_duration: int = None) -> str:
+    """오디오 클립 생성 (사용자 설정에 따른 길이, ffmpeg 스트림 복사)"""
     # 사용자 설정 duration 우선 사용
     if clip_duration is not None:
         duration = clip_duration
     try:
-        audio = AudioSegment.from_mp3(audio_path)
+        if audio_duration is None:
+            audio_duration = get_audio_duration(audio_path)
         
         # 파일이 너무 짧으면 처음부터 사용 가능한 시간만큼
-        if len(audio) < (start_time + duration) * 1000:
-            start_time = max(0, len(audio) // 1000 - duration)
-            if start_time < 0:
-                start_time = 0
-                duration = len(audio) // 1000
-        
-        start_ms = start_time * 1000
-        end_ms = start_ms + (duration * 1000)
-        
-        clip = audio[start_ms:end_ms]
+        if audio_duration < start_time + duration:
+            start_time = max(0, audio_duration - duration)
+            duration = min(duration, audio_duration)
         
         # 클립 파일명 생성
-        basename = Path(audio_path).stem
+        basename = get_audio_title(audio_path)
         clean_name = clean_filename(basename)
         clip_filename = f"{clean_name}_clip.mp3"
         clip_path = CLIPS_DIR / clip_filename
         
-        # 클립 저장
-        clip.export(str(clip_path), format="mp3")
+        # MP3 프레임 단위 복사로 클립 저장 (디코딩/재인코딩 없음)
+        cmd = [
+            'ffmpeg',
+            '-y',
+            '-loglevel', 'error',
+            '-ss', str(start_time),
+            '-t', str(duration),
+            '-i', audio_path,
+            '-acodec', 'copy',
+            str(clip_path)
+        ]
+        try:
+            subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError:
+            # 스트림 복사가 불가능한 경우에만 디코딩 후 재인코딩
+            export_clip_reencoded(audio_path, clip_path, start_time, duration)
         
         print(f"클립 생성: {clip_path}")
         return str(clip_path)
@@ -435,10 +779,15 @@ def create_clip(audio_path: str, start_time: int = 30, duration: int = 15, clip_
         print(f"클립 생성 실패 {audio_path}: {e}")
         return None
 
+def create_clip_worker(job: Tuple[str, int, int, int]) -> Optional[str]:
+    """프로세스 풀용 클립 생성 작업 (audio_path, start_time, duration, audio_duration)"""
+    audio_path, start_time, duration, audio_duration = job
+    return create_clip(audio_path, start_time, duration, audio_duration=audio_duration)
+
 # quiz.json 관련 함수들은 제거됨 - 이제 Supabase 데이터베이스를 사용
 
 def print_progress(current: int, total: int, step: str, song_title: str = "", start_time: float = None):
-    """진행률 출력 (스레드 안전)"""
+    """진행률 출력 (스레드 안전, 출력 스레드로 전달)"""
     percentage = (current / total) * 100 if total > 0 else 0
     
     progress_info = {
@@ -450,8 +799,7 @@ def print_progress(current: int, total: int, step: str, song_title: str = "", st
         "song_title": song_title,
         "current_video_title": song_title,
         "processing_stage": step,
-        "remaining_count": max(0, total - current),
-        "timestamp": datetime.now().isoformat()
+        "remaining_count": max(0, total - current)
     }
     
     if start_time:
@@ -462,14 +810,12 @@ def print_progress(current: int, total: int, step: str, song_title: str = "", st
             progress_info["estimated_remaining_seconds"] = round(remaining)
             progress_info["estimated_remaining_minutes"] = round(remaining / 60, 1)
     
-    print(f"PROGRESS: {json.dumps(progress_info, ensure_ascii=False)}")
-    
     # 사람이 읽기 쉬운 형태로도 출력
     eta_str = ""
     if "estimated_remaining_minutes" in progress_info:
         eta_str = f" (예상 남은 시간: {progress_info['estimated_remaining_minutes']}분)"
     
-    print(f"[{current}/{total}] {step}: {song_title} ({percentage:.1f}%){eta_str}")
+    progress_printer.emit(progress_info, f"[{current}/{total}] {step}: {song_title} ({percentage:.1f}%){eta_str}")
 
 def print_enhanced_progress(current: int, total: int, step: str, song_title: str = "", start_time: float = None):
     """향상된 진행률 출력 (완료된 비디오 목록 및 활성 작업자 포함)"""
@@ -485,8 +831,7 @@ def print_enhanced_progress(current: int, total: int, step: str, song_title: str
         "song_title": song_title,
         "current_video_title": song_title,
         "processing_stage": step,
-        "remaining_count": max(0, total - current),
-        "timestamp": datetime.now().isoformat()
+        "remaining_count": max(0, total - current)
     }
     
     # 시간 추정 정보 추가
@@ -502,14 +847,12 @@ def print_enhanced_progress(current: int, total: int, step: str, song_title: str
     tracker_data = progress_tracker.get_progress_data()
     progress_info.update(tracker_data)
     
-    print(f"PROGRESS: {json.dumps(progress_info, ensure_ascii=False)}")
-    
     # 사람이 읽기 쉬운 형태로도 출력
     eta_str = ""
     if "estimated_remaining_minutes" in progress_info:
         eta_str = f" (예상 남은 시간: {progress_info['estimated_remaining_minutes']}분)"
     
-    print(f"[{current}/{total}] {step}: {song_title} ({percentage:.1f}%){eta_str}")
+    progress_printer.emit(progress_info, f"[{current}/{total}] {step}: {song_title} ({percentage:.1f}%){eta_str}")
 
 def print_parallel_progress(completed: int, total: int, successful: int, failed: int, current_song: str = ""):
     """병렬 처리 전용 진행률 출력 (향상된 정보 포함)"""
@@ -526,16 +869,14 @@ def print_parallel_progress(completed: int, total: int, successful: int, failed:
         "current_song": current_song,
         "current_video_title": current_song,
         "processing_stage": "병렬 처리 중",
-        "remaining_count": max(0, total - completed),
-        "timestamp": datetime.now().isoformat()
+        "remaining_count": max(0, total - completed)
     }
     
     # 진행률 추적기에서 추가 정보 가져오기
     tracker_data = progress_tracker.get_progress_data()
     progress_info.update(tracker_data)
     
-    print(f"PROGRESS: {json.dumps(progress_info, ensure_ascii=False)}")
-    print(f"[{completed}/{total}] 병렬 처리 중 - 성공: {successful}, 실패: {failed} ({percentage:.1f}%)")
+    progress_printer.emit(progress_info, f"[{completed}/{total}] 병렬 처리 중 - 성공: {successful}, 실패: {failed} ({percentage:.1f}%)")
 
 def get_user_settings():
     """사용자 설정 로드 (기본값 포함)"""
@@ -544,6 +885,7 @@ def get_user_settings():
         "clip_start_offset": 30,  # 기본값 30초 지점에서 시작
         "cleanup_full_downloads": True,  # 클립 생성 후 전체 파일 삭제
         "download_only_clip_duration": False,  # 전체 다운로드 대신 클립 길이만 다운로드
+        "cache_playlists": False,  # 플레이리스트 확장 결과를 1시간 동안 재사용 (그 사이 추가된 곡은 반영되지 않음)
         "parallel_processing": True,  # 병렬 처리 활성화
         "max_workers": MAX_WORKERS  # 최대 동시 작업 수
     }
@@ -572,134 +914,361 @@ def get_user_settings():
     
     return settings
 
+def dumps_json(data: Any) -> bytes:
+    """JSON 직렬화 (orjson이 있으면 사용, 들여쓰기 2칸/UTF-8 유지)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+def loads_json(raw: bytes) -> Any:
+    """JSON 역직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def load_clip_cache() -> Dict[str, Dict[str, Any]]:
+    """비디오 ID별 클립 캐시 로드"""
+    try:
+        return loads_json(CLIP_CACHE_PATH.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"클립 캐시 로드 실패 (캐시 없이 진행): {e}")
+        return {}
+
+def save_clip_cache(cache: Dict[str, Dict[str, Any]]):
+    """비디오 ID별 클립 캐시 저장"""
+    try:
+        CLIP_CACHE_PATH.write_bytes(dumps_json(cache))
+    except Exception as e:
+        print(f"클립 캐시 저장 실패: {e}")
+
+def load_playlist_cache() -> Dict[str, Dict[str, Any]]:
+    """플레이리스트 ID별 확장 결과 캐시 로드"""
+    try:
+        return loads_json(PLAYLIST_CACHE_PATH.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"플레이리스트 캐시 로드 실패 (캐시 없이 진행): {e}")
+        return {}
+
+def save_playlist_cache(cache: Dict[str, Dict[str, Any]]):
+    """플레이리스트 ID별 확장 결과 캐시 저장 (만료된 항목은 제외)"""
+    now = time.time()
+    fresh = {playlist_id: entry for playlist_id, entry in cache.items() if now - entry['fetched_at'] < PLAYLIST_CACHE_TTL}
+    try:
+        PLAYLIST_CACHE_PATH.write_bytes(dumps_json(fresh))
+    except Exception as e:
+        print(f"플레이리스트 캐시 저장 실패: {e}")
+
+def get_cached_song(cache: Dict[str, Dict[str, Any]], url: str, user_settings: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """캐시된 클립이 그대로 남아 있고 설정이 같으면 곡 데이터 반환"""
+    video_id = extract_video_id(url)
+    entry = cache.get(video_id) if video_id else None
+    if not entry:
+        return None
+    
+    metadata = entry['metadata']
+    if (metadata['clip_duration'] != user_settings['clip_duration']
+            or metadata['clip_start_offset'] != user_settings['clip_start_offset']):
+        return None
+    
+    try:
+        if Path(entry['clip_path']).stat().st_mtime != entry['mtime']:
+            return None
+    except OSError:
+        return None
+    
+    # API는 최근 수정된 클립만 수집하므로 재사용하는 클립의 수정 시간을 갱신
+    os.utime(entry['clip_path'])
+    entry['mtime'] = Path(entry['clip_path']).stat().st_mtime
+    
+    return {
+        'title': metadata['title'],
+        'album': metadata['album'],
+        'audio_path': entry['audio_path'],
+        'clip_path': entry['clip_path'],
+        'duration': metadata['duration'],
+        'clip_start': metadata['clip_start'],
+        'clip_duration': metadata['clip_duration']
+    }
+
+def get_cached_audio(cache: Dict[str, Dict[str, Any]], url: str) -> Optional[str]:
+    """설정이 바뀌어 클립을 다시 만들어야 할 때 재사용할 수 있는 원본 오디오 경로 반환 (곡 전체를 받은 파일만)"""
+    video_id = extract_video_id(url)
+    entry = cache.get(video_id) if video_id else None
+    # 구간만 받은 파일은 다른 시작 지점의 클립을 만들 수 없고, 기록이 없는 예전 항목도 확인할 수 없으므로 제외
+    if not entry or entry.get('audio_trimmed', True):
+        return None
+    audio_path = entry.get('audio_path')
+    if audio_path and os.path.isfile(audio_path):
+        return audio_path
+    return None
+
+def update_clip_cache(cache: Dict[str, Dict[str, Any]], results: List[ProcessingResult], user_settings: Dict[str, Any]):
+    """처리에 성공한 곡들을 캐시에 기록"""
+    for result in results:
+        video_id = extract_video_id(result.url)
+        song_data = result.song_data
+        if not video_id:
+            continue
+        
+        try:
+            mtime = Path(song_data['clip_path']).stat().st_mtime
+        except OSError:
+            continue
+        
+        audio_path = song_data['audio_path']
+        cache[video_id] = {
+            'audio_path': audio_path,
+            'audio_trimmed': audio_path is not None and is_trimmed_audio(audio_path),
+            'clip_path': song_data['clip_path'],
+            'metadata': {
+                'title': song_data['title'],
+                'album': song_data['album'],
+                'duration': song_data['duration'],
+                'clip_start': song_data['clip_start'],
+                'clip_duration': song_data['clip_duration'],
+                'clip_start_offset': user_settings['clip_start_offset']
+            },
+            'mtime': mtime
+        }
+
+async def process_urls_async(urls: List[str], user_settings: Dict[str, Any], start_time: float, local_audio: Optional[Dict[str, str]] = None) -> Tuple[List[ProcessingResult], List[ProcessingResult]]:
+    """다운로드 → 후처리 → 집계를 asyncio.Queue로 연결한 파이프라인으로 URL들을 처리 (local_audio: 이미 받아 둔 URL별 원본 경로)"""
+    total_songs = len(urls)
+    if local_audio is None:
+        local_audio = {}
+    # 다운로드 완료 항목 (index, url, audio_path, processing_start), 종료 신호는 None
+    download_q: asyncio.Queue = asyncio.Queue()
+    # 후처리 결과 (ProcessingResult)
+    result_q: asyncio.Queue = asyncio.Queue()
+    successful_results = []
+    failed_results = []
+    # 같은 오디오 파일은 한 번만 후처리하고 결과를 나머지 URL에 복사 (후처리 중 원본이 삭제되거나 같은 클립을 두 번 쓰지 않도록)
+    # 오디오 경로 -> 처리 결과 (처리 중이면 None) / 결과를 기다리는 입력 URL 목록
+    clip_results: Dict[str, Optional[ProcessingResult]] = {}
+    clip_waiting: Dict[str, List[str]] = {}
+    
+    async def enqueue_audio(index: int, url: str, audio_path: Optional[str], processing_start: float):
+        if audio_path is not None:
+            if audio_path in clip_results:
+                result = clip_results[audio_path]
+                if result is None:
+                    clip_waiting[audio_path].append(url)
+                else:
+                    await result_q.put(replace(result, url=url))
+                return
+            clip_results[audio_path] = None
+            clip_waiting[audio_path] = []
+        await download_q.put((index, url, audio_path, processing_start))
+    
+    async def download_chunk(chunk: List[Tuple[int, str]], chunk_number: int):
+        # 청크 단위로 YoutubeDL 인스턴스 하나를 사용하여 연결/추출기 캐시를 공유 (다운로드 시간은 download_audio_batch에서 곡별로 측정)
+        processing_start = time.time()
+        worker_id = f"batch_{chunk_number}"
+        chunk_title = f"곡 {chunk[0][0]}-{chunk[-1][0]}/{total_songs}"
+        # 입력 URL -> 같은 URL의 index 목록 (다운로드 결과는 입력 URL 기준으로 돌아옴)
+        pending: Dict[str, List[int]] = {}
+        for index, url in chunk:
+            pending.setdefault(url, []).append(index)
+        chunk_urls = list(pending)
+        
+        progress_tracker.set_worker_status(worker_id, chunk_title, "다운로드 중")
+        print_enhanced_progress(chunk[0][0], total_songs, "다운로드 중", chunk_title, start_time)
+        
+        try:
+            # 곡 하나가 다운로드될 때마다 바로 후처리 큐로 전달
+            async for url, audio_path in download_audio_batch(chunk_urls, session, clip_pool, download_limit, user_settings):
+                for index in pending.pop(url, []):
+                    await enqueue_audio(index, url, audio_path, processing_start)
+        except Exception as e:
+            print(f"배치 다운로드 오류 ({chunk_title}): {e}")
+        finally:
+            progress_tracker.remove_worker(worker_id)
+        
+        # 다운로드되지 않은 URL은 실패로 처리되도록 경로 없이 전달
+        for url, indices in pending.items():
+            for index in indices:
+                await enqueue_audio(index, url, None, processing_start)
+    
+    async def download_all(chunks: List[List[Tuple[int, str]]]):
+        # 원본이 남아 있는 곡은 다운로드 없이 바로 후처리 큐로 전달
+        for index, url in indexed_urls:
+            if url in local_audio:
+                await enqueue_audio(index, url, local_audio[url], time.time())
+        
+        async with asyncio.TaskGroup() as downloads:
+            for chunk_number, chunk in enumerate(chunks, 1):
+                downloads.create_task(download_chunk(chunk, chunk_number))
+        
+        # 모든 다운로드가 끝나면 후처리 작업자들에게 종료 신호 전달
+        for _ in range(CLIP_WORKERS):
+            await download_q.put(None)
+    
+    async def clip_worker():
+        while (item := await download_q.get()) is not None:
+            index, url, audio_path, processing_start = item
+            try:
+                result = await process_single_url(url, index, total_songs, audio_path, user_settings, start_time, processing_start, clip_pool)
+            except Exception as e:
+                result = ProcessingResult(
+                    success=False,
+                    url=url,
+                    error=f"작업 실행 오류: {str(e)}"
+                )
+            await result_q.put(result)
+            if audio_path is not None:
+                clip_results[audio_path] = result
+                for waiting_url in clip_waiting.pop(audio_path):
+                    await result_q.put(replace(result, url=waiting_url))
+    
+    async def aggregate():
+        # 결과 집계는 이 코루틴에서만 수행되므로 별도 잠금이 필요 없음
+        for completed_count in range(1, total_songs + 1):
+            result = await result_q.get()
+            
+            if result.success:
+                successful_results.append(result)
+                
+                # 성공 로그
+                progress_printer.emit(None, f"✓ [{completed_count}/{total_songs}] 성공: {result.song_data['title']} ({result.processing_time:.1f}초)")
+            else:
+                failed_results.append(result)
+                
+                # 실패 로그
+                progress_printer.emit(None, f"✗ [{completed_count}/{total_songs}] 실패: {result.error} ({result.processing_time:.1f}초)")
+            
+            # 중간 진행률 업데이트
+            if completed_count % 5 == 0 or completed_count == total_songs:
+                progress_info = {
+                    "type": "batch_progress",
+                    "completed": completed_count,
+                    "current": completed_count,
+                    "total": total_songs,
+                    "successful": len(successful_results),
+                    "failed": len(failed_results),
+                    "percentage": round((completed_count / total_songs) * 100, 1),
+                    "processing_stage": "병렬 처리 중",
+                    "remaining_count": max(0, total_songs - completed_count),
+                    "message": f"병렬 처리 진행 중: {completed_count}/{total_songs} 완료 (성공: {len(successful_results)}, 실패: {len(failed_results)})"
+                }
+                
+                # 진행률 추적기에서 추가 정보 가져오기
+                tracker_data = progress_tracker.get_progress_data()
+                progress_info.update(tracker_data)
+                
+                progress_printer.emit(progress_info)
+    
+    # URL을 MAX_WORKERS개 청크로 나누어 청크별 배치 다운로드
+    indexed_urls = list(enumerate(urls, 1))
+    download_urls = [(index, url) for index, url in indexed_urls if url not in local_audio]
+    chunk_size = max(1, -(-len(download_urls) // MAX_WORKERS))
+    
+    # 같은 영상으로 보이는 URL은 같은 청크에 넣어 한 번만 받도록 함 (청크끼리는 같은 파일을 동시에 쓰지 않음)
+    same_video: Dict[str, List[Tuple[int, str]]] = {}
+    for index, url in download_urls:
+        same_video.setdefault(extract_video_id(url) or url, []).append((index, url))
+    chunks: List[List[Tuple[int, str]]] = []
+    for group in same_video.values():
+        if not chunks or len(chunks[-1]) >= chunk_size:
+            chunks.append([])
+        chunks[-1].extend(group)
+    
+    # 스트림 다운로드는 청크 전체에서 MAX_WORKERS개로, 후처리는 CPU 코어 수(CLIP_WORKERS)로 동시 실행 수를 제한
+    download_limit = asyncio.Semaphore(MAX_WORKERS)
+    # 스레드가 이미 실행 중이므로 fork 대신 spawn으로 클립 프로세스를 생성
+    # MP3 변환도 같은 프로세스 풀을 사용하고, HTTP 세션은 모든 다운로드가 공유
+    with ProcessPoolExecutor(max_workers=CLIP_WORKERS, mp_context=multiprocessing.get_context('spawn')) as clip_pool:
+        async with aiohttp.ClientSession(timeout=DOWNLOAD_TIMEOUT) as session, asyncio.TaskGroup() as tg:
+            tg.create_task(download_all(chunks))
+            for _ in range(CLIP_WORKERS):
+                tg.create_task(clip_worker())
+            tg.create_task(aggregate())
+    
+    # 이후의 요약 출력이 진행률 출력보다 먼저 나오지 않도록 대기
+    progress_printer.flush()
+    
+    return successful_results, failed_results
+
 def process_urls_parallel(urls: List[str], user_settings: Dict[str, Any] = None):
     """URL 목록을 병렬로 처리 (성능 최적화)"""
     if user_settings is None:
         user_settings = get_user_settings()
     
-    all_songs_data = []
     start_time = time.time()
     
     # 플레이리스트 확장
-    original_urls = urls[:]
-    expanded_urls = []
-    
     print("=== 플레이리스트 확장 중... ===")
     
     # 진행률 정보 출력 (플레이리스트 확장 시작)
     progress_info = {
         "type": "playlist_expansion",
         "status": "starting",
-        "message": "플레이리스트에서 비디오 목록을 가져오고 있습니다...",
-        "timestamp": datetime.now().isoformat()
+        "message": "플레이리스트에서 비디오 목록을 가져오고 있습니다..."
     }
-    print(f"PROGRESS: {json.dumps(progress_info, ensure_ascii=False)}")
-    
-    for i, url in enumerate(original_urls, 1):
-        if is_playlist_url(url):
-            progress_info = {
-                "type": "playlist_processing",
-                "current_playlist": i,
-                "total_playlists": len(original_urls),
-                "message": f"플레이리스트 {i}/{len(original_urls)} 처리 중...",
-                "timestamp": datetime.now().isoformat()
-            }
-            print(f"PROGRESS: {json.dumps(progress_info, ensure_ascii=False)}")
-            
-            individual_urls = extract_playlist_urls(url)
-            expanded_urls.extend(individual_urls)
-            print(f"플레이리스트에서 {len(individual_urls)}개 비디오 발견")
-        else:
-            expanded_urls.append(url)
+    progress_printer.emit(progress_info)
+    
+    # 플레이리스트 캐시는 설정으로 켠 경우에만 사용 (캐시 유지 시간 동안 새로 추가된 곡은 빠짐)
+    playlist_cache = load_playlist_cache() if user_settings.get('cache_playlists', False) else None
+    expanded_urls = asyncio.run(expand_playlist_urls(urls, playlist_cache))
+    if playlist_cache is not None and any(is_playlist_url(url) for url in urls):
+        save_playlist_cache(playlist_cache)
     
     total_songs = len(expanded_urls)
+    
+    # 이미 처리되어 클립이 남아 있는 URL은 캐시에서 재사용
+    clip_cache = load_clip_cache()
+    cached_results = []
+    pending_urls = []
+    local_audio = {}
+    for url in expanded_urls:
+        cached_song = get_cached_song(clip_cache, url, user_settings)
+        if cached_song:
+            cached_results.append(ProcessingResult(success=True, url=url, song_data=cached_song))
+            progress_tracker.add_completed_video(cached_song['title'], "success")
+            continue
+        
+        pending_urls.append(url)
+        # 클립 설정만 바뀐 경우 남아 있는 전체 다운로드 파일에서 클립만 다시 생성
+        cached_audio = get_cached_audio(clip_cache, url)
+        if cached_audio:
+            local_audio[url] = cached_audio
+    
+    if cached_results:
+        print(f"캐시된 클립 {len(cached_results)}개 재사용 (처리 생략)")
+    if local_audio:
+        print(f"보관된 원본 {len(local_audio)}개로 클립 재생성 (다운로드 생략)")
+    
     print(f"총 {total_songs}개 곡 병렬 처리 시작 (최대 {MAX_WORKERS}개 동시 처리)")
     
     # 정확한 총 개수로 진행률 시작
     progress_info = {
         "type": "processing_start",
         "total_songs": total_songs,
-        "message": f"총 {total_songs}개 곡을 병렬로 다운로드 및 클립 생성합니다 (최대 {MAX_WORKERS}개 동시 처리)",
-        "timestamp": datetime.now().isoformat()
+        "message": f"총 {total_songs}개 곡을 병렬로 다운로드 및 클립 생성합니다 (최대 {MAX_WORKERS}개 동시 처리)"
     }
-    print(f"PROGRESS: {json.dumps(progress_info, ensure_ascii=False)}")
+    progress_printer.emit(progress_info)
     
     # 병렬 처리 실행
-    successful_results = []
-    failed_results = []
-    completed_count = 0
+    successful_results, failed_results = asyncio.run(
+        process_urls_async(pending_urls, user_settings, start_time, local_audio)
+    )
     
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        # 모든 작업을 제출
-        future_to_url = {
-            executor.submit(process_single_url, url, i, total_songs, user_settings, start_time): (url, i)
-            for i, url in enumerate(expanded_urls, 1)
-        }
-        
-        # 완료된 작업들을 처리
-        for future in as_completed(future_to_url):
-            url, index = future_to_url[future]
-            completed_count += 1
-            
-            try:
-                result = future.result()
-                
-                if result.success:
-                    successful_results.append(result)
-                    all_songs_data.append(result.song_data)
-                    
-                    # 성공 로그
-                    with PROGRESS_LOCK:
-                        print(f"✓ [{completed_count}/{total_songs}] 성공: {result.song_data['title']} ({result.processing_time:.1f}초)")
-                else:
-                    failed_results.append(result)
-                    
-                    # 실패 로그
-                    with PROGRESS_LOCK:
-                        print(f"✗ [{completed_count}/{total_songs}] 실패: {result.error} ({result.processing_time:.1f}초)")
-                
-                # 중간 진행률 업데이트
-                if completed_count % 5 == 0 or completed_count == total_songs:
-                    with PROGRESS_LOCK:
-                        progress_info = {
-                            "type": "batch_progress",
-                            "completed": completed_count,
-                            "current": completed_count,
-                            "total": total_songs,
-                            "successful": len(successful_results),
-                            "failed": len(failed_results),
-                            "percentage": round((completed_count / total_songs) * 100, 1),
-                            "processing_stage": "병렬 처리 중",
-                            "remaining_count": max(0, total_songs - completed_count),
-                            "message": f"병렬 처리 진행 중: {completed_count}/{total_songs} 완료 (성공: {len(successful_results)}, 실패: {len(failed_results)})",
-                            "timestamp": datetime.now().isoformat()
-                        }
-                        
-                        # 진행률 추적기에서 추가 정보 가져오기
-                        tracker_data = progress_tracker.get_progress_data()
-                        progress_info.update(tracker_data)
-                        
-                        print(f"PROGRESS: {json.dumps(progress_info, ensure_ascii=False)}")
-                        
-            except Exception as e:
-                failed_results.append(ProcessingResult(
-                    success=False,
-                    url=url,
-                    error=f"작업 실행 오류: {str(e)}"
-                ))
-                completed_count += 1
-                
-                with PROGRESS_LOCK:
-                    print(f"✗ [{completed_count}/{total_songs}] 작업 실행 오류: {str(e)}")
+    # 캐시는 곡마다가 아니라 처리가 끝난 뒤 한 번만 저장
+    if successful_results or cached_results:
+        update_clip_cache(clip_cache, successful_results, user_settings)
+        save_clip_cache(clip_cache)
     
     # 처리 완료 통계
     total_time = time.time() - start_time
-    success_count = len(successful_results)
+    success_count = len(successful_results) + len(cached_results)
     failure_count = len(failed_results)
     
     print(f"\n=== 병렬 처리 완료 ===")
     print(f"총 처리 시간: {total_time:.1f}초")
-    print(f"성공: {success_count}개")
+    print(f"성공: {success_count}개 (캐시 재사용 {len(cached_results)}개)")
     print(f"실패: {failure_count}개")
     
     if successful_results:
@@ -715,12 +1284,12 @@ def process_urls_parallel(urls: List[str], user_settings: Dict[str, Any] = None)
             print(f"  ... 및 {len(failed_results) - 5}개 더")
     
     # 최종 완료 메시지
-    if all_songs_data:
+    if success_count:
         progress_info = {
             "type": "completion",
-            "total_processed": len(all_songs_data),
+            "total_processed": success_count,
             "total_failed": failure_count,
-            "successful": len(all_songs_data),
+            "successful": success_count,
             "failed": failure_count,
             "processing_time": round(total_time, 1),
             "current": total_songs,
@@ -728,16 +1297,15 @@ def process_urls_parallel(urls: List[str], user_settings: Dict[str, Any] = None)
             "percentage": 100.0,
             "processing_stage": "완료",
             "remaining_count": 0,
-            "message": f"병렬 처리 완료! 총 {len(all_songs_data)}개 클립 생성 성공 ({failure_count}개 실패)",
-            "timestamp": datetime.now().isoformat()
+            "message": f"병렬 처리 완료! 총 {success_count}개 클립 생성 성공 ({failure_count}개 실패)"
         }
         
         # 최종 완료된 비디오 목록 포함
         tracker_data = progress_tracker.get_progress_data()
         progress_info.update(tracker_data)
         
-        print(f"PROGRESS: {json.dumps(progress_info, ensure_ascii=False)}")
-        print(f"총 {len(all_songs_data)}개 노래 처리 완료!")
+        progress_printer.emit(progress_info)
+        print(f"총 {success_count}개 노래 처리 완료!")
     else:
         progress_info = {
             "type": "completion",
@@ -751,15 +1319,14 @@ def process_urls_parallel(urls: List[str], user_settings: Dict[str, Any] = None)
             "percentage": 100.0,
             "processing_stage": "완료 (실패)",
             "remaining_count": 0,
-            "message": "처리된 노래가 없습니다.",
-            "timestamp": datetime.now().isoformat()
+            "message": "처리된 노래가 없습니다."
         }
         
         # 실패한 비디오 목록 포함
         tracker_data = progress_tracker.get_progress_data()
         progress_info.update(tracker_data)
         
-        print(f"PROGRESS: {json.dumps(progress_info, ensure_ascii=False)}")
+        progress_printer.emit(progress_info)
         print("처리된 노래가 없습니다.")
 
 def process_urls(urls: List[str], user_settings: Dict[str, Any] = None):
@@ -793,7 +1360,8 @@ def main():
     user_id = os.path.basename(urls_file).replace('.txt', '').replace('temp_urls_', '')
     
     try:
-        performance_logger = init_performance_logger(session_id, user_id)
+        # 단계별 성능 PROGRESS 줄도 진행률 출력 스레드에서 모아서 출력
+        performance_logger = init_performance_logger(session_id, user_id, progress_printer.emit)
         print(f"성능 로깅 시작: 세션 ID {session_id}, 사용자 ID {user_id}")
     except Exception as e:
         print(f"성능 로깅 초기화 실패 (계속 진행): {e}")
@@ -811,6 +1379,8 @@ def main():
     global MAX_WORKERS
     MAX_WORKERS = user_settings['max_workers']
     
+    progress_printer.start()
+    
     try:
         # URL 처리
         if user_settings['parallel_processing']:
@@ -820,6 +1390,9 @@ def main():
             print("순차 처리 모드는 현재 병렬 처리로 대체되었습니다.")
             process_urls_parallel(urls, user_settings)
     finally:
+        # 남은 진행률 출력 기록 후 출력 스레드 종료
+        progress_printer.stop()
+        
         # 성능 로깅 종료
         try:
             session_performance = finalize_performance_logging()
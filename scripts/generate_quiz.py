@@ -5,22 +5,43 @@ quiz.json에서 노래 데이터를 읽어 자동으로 객관식 퀴즈를 생
 """
 
 import json
+import os
 import random
 import sys
+import time
 from pathlib import Path
 from typing import List, Dict, Any
-from datetime import datetime
+
+try:
+    import orjson  # 선택 사항: 설치되어 있으면 더 빠른 JSON 직렬화 사용
+except ImportError:
+    orjson = None
 
 # 프로젝트 루트 디렉토리
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "public" / "data"
 QUIZ_JSON_PATH = DATA_DIR / "quiz.json"
 
+def utc_now_iso() -> str:
+    """현재 UTC 시각의 ISO 8601 문자열 (datetime 객체 없이 생성)"""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+def dumps_json(data: Any) -> bytes:
+    """JSON 직렬화 (orjson이 있으면 사용, 들여쓰기 2칸/UTF-8 유지)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+def loads_json(raw: bytes) -> Any:
+    """JSON 역직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 def load_quiz_data() -> Dict[str, Any]:
     """quiz.json 데이터 로드"""
     try:
-        with open(QUIZ_JSON_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return loads_json(QUIZ_JSON_PATH.read_bytes())
     except (FileNotFoundError, json.JSONDecodeError) as e:
         print(f"quiz.json 로드 실패: {e}")
         return {
@@ -31,31 +52,56 @@ def load_quiz_data() -> Dict[str, Any]:
         }
 
 def save_quiz_data(data: Dict[str, Any]):
-    """quiz.json 데이터 저장"""
+    """quiz.json 데이터 저장 (임시 파일에 쓴 뒤 교체하여 중간에 실패해도 기존 파일 유지)"""
+    tmp_path = QUIZ_JSON_PATH.with_suffix('.json.tmp')
     try:
         DATA_DIR.mkdir(parents=True, exist_ok=True)
-        with open(QUIZ_JSON_PATH, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        tmp_path.write_bytes(dumps_json(data))
+        os.replace(tmp_path, QUIZ_JSON_PATH)
         print("quiz.json 저장 완료")
     except Exception as e:
         print(f"quiz.json 저장 실패: {e}")
 
-def generate_wrong_options(correct_title: str, all_songs: List[Dict], option_count: int = 4) -> List[str]:
-    """틀린 보기 생성"""
-    # 정답을 제외한 다른 곡 제목들
-    wrong_titles = [song['title'] for song in all_songs if song['title'] != correct_title]
-    
-    if len(wrong_titles) < option_count - 1:
-        print(f"경고: 사용 가능한 노래가 부족합니다. 필요: {option_count-1}, 보유: {len(wrong_titles)}")
-        # 부족한 만큼 임의의 제목 생성
-        fake_titles = [
-            "Unknown Song A", "Unknown Song B", "Unknown Song C",
-            "Mystery Track", "Hidden Gem", "Secret Song"
-        ]
-        wrong_titles.extend(fake_titles)
+def add_game(data: Dict[str, Any], game: Dict[str, Any]):
+    """게임 추가 (같은 ID의 게임이 이미 있으면 기존 최대 번호 + 1로 ID 변경)"""
+    existing_ids = {existing['id'] for existing in data['games']}
+    if game['id'] in existing_ids:
+        suffixes = (game_id.rpartition('-')[2] for game_id in existing_ids)
+        next_number = max((int(suffix) for suffix in suffixes if suffix.isdigit()), default=0) + 1
+        game['id'] = f"game-{next_number}"
+    data['games'].append(game)
+
+def generate_wrong_options(correct_title: str, all_titles: List[str], option_count: int = 4) -> List[str]:
+    """틀린 보기 생성 (all_titles: 중복 없는 전체 곡 제목 목록)"""
+    wrong_count = option_count - 1
     
-    # 랜덤하게 틀린 답 선택
-    selected_wrong = random.sample(wrong_titles, min(option_count - 1, len(wrong_titles)))
+    if len(all_titles) > wrong_count:
+        # 제목이 충분하면 Floyd 알고리즘으로 보기 수(정답 몫 포함)만큼의 인덱스만 중복 없이 뽑음
+        title_count = len(all_titles)
+        picked = set()
+        for j in range(title_count - option_count, title_count):
+            index = random.randrange(j + 1)
+            picked.add(j if index in picked else index)
+        
+        # 정답이 뽑혔으면 정답을, 아니면 임의의 하나를 빼서 틀린 보기 수를 맞춤
+        selected_wrong = [all_titles[index] for index in picked if all_titles[index] != correct_title]
+        if len(selected_wrong) > wrong_count:
+            selected_wrong.pop(random.randrange(len(selected_wrong)))
+    else:
+        # 정답을 제외한 다른 곡 제목들
+        wrong_titles = [title for title in all_titles if title != correct_title]
+        
+        if len(wrong_titles) < wrong_count:
+            print(f"경고: 사용 가능한 노래가 부족합니다. 필요: {wrong_count}, 보유: {len(wrong_titles)}")
+            # 부족한 만큼 임의의 제목 생성
+            fake_titles = [
+                "Unknown Song A", "Unknown Song B", "Unknown Song C",
+                "Mystery Track", "Hidden Gem", "Secret Song"
+            ]
+            wrong_titles.extend(fake_titles)
+        
+        # 랜덤하게 틀린 답 선택
+        selected_wrong = random.sample(wrong_titles, min(wrong_count, len(wrong_titles)))
     
     # 정답과 함께 섞기
     all_options = selected_wrong + [correct_title]
@@ -73,16 +119,16 @@ def create_quiz_game(
 ) -> Dict[str, Any]:
     """퀴즈 게임 생성"""
     
-    # 선택된 노래들 필터링
-    selected_songs = [song for song in all_songs if song['id'] in selected_song_ids]
+    # 선택된 노래들 필터링 (ID 목록을 전체 노래와 비교하지 않고 ID로 바로 조회, 중복 ID는 한 번만)
+    songs_by_id = {song['id']: song for song in all_songs}
+    selected_songs = [songs_by_id[song_id] for song_id in dict.fromkeys(selected_song_ids) if song_id in songs_by_id]
     
     if len(selected_songs) < question_count:
         print(f"경고: 요청한 문제 수({question_count})보다 선택된 노래가 적습니다({len(selected_songs)})")
         question_count = len(selected_songs)
     
-    # 랜덤하게 섞어서 문제 수만큼 선택
-    random.shuffle(selected_songs)
-    game_songs = selected_songs[:question_count]
+    # 문제 수만큼만 무작위로 선택 (전체를 섞지 않음)
+    game_songs = random.sample(selected_songs, question_count)
     
     # 난이도별 보기 수
     option_counts = {
@@ -92,31 +138,32 @@ def create_quiz_game(
     }
     option_count = option_counts.get(difficulty, 4)
     
-    # 문제 생성
-    questions = []
-    for i, song in enumerate(game_songs):
-        options = generate_wrong_options(song['title'], all_songs, option_count)
-        
-        question = {
-            "id": f"q{i+1}",
+    # 보기 후보 제목은 문제마다 다시 만들지 않고 한 번만 준비 (같은 제목이 두 번 보기로 나오지 않도록 중복 제거)
+    all_titles = list(dict.fromkeys(song['title'] for song in all_songs))
+    
+    # 문제 생성 (append 없이 한 번에 목록 생성)
+    questions = [
+        {
+            "id": f"q{number}",
             "clip": song['clipPath'],
             "question": "이 노래의 제목은?",
             "correctAnswer": song['title'],
-            "options": options,
+            "options": generate_wrong_options(song['title'], all_titles, option_count),
             "artist": song['artist'],
             "album": song['album']
         }
-        questions.append(question)
+        for number, song in enumerate(game_songs, 1)
+    ]
     
     # 게임 데이터 생성
-    game_id = f"game-{int(datetime.now().timestamp())}"
+    game_id = f"game-{int(time.time())}"
     game = {
         "id": game_id,
         "name": name,
         "description": description,
         "difficulty": difficulty,
         "questionCount": len(questions),
-        "created": datetime.now().isoformat() + 'Z',
+        "created": utc_now_iso(),
         "questions": questions
     }
     
@@ -143,11 +190,9 @@ def auto_generate_sample_game(all_songs: List[Dict]) -> Dict[str, Any]:
     )
 
 def list_available_songs(songs: List[Dict]):
-    """사용 가능한 노래 목록 표시"""
-    print("\n=== 사용 가능한 노래 목록 ===")
-    for i, song in enumerate(songs, 1):
-        print(f"{i:2d}. {song['artist']} - {song['title']} (ID: {song['id']})")
-    print()
+    """사용 가능한 노래 목록 표시 (목록 전체를 한 번에 출력)"""
+    lines = "".join(f"{i:2d}. {song['artist']} - {song['title']} (ID: {song['id']})\n" for i, song in enumerate(songs, 1))
+    sys.stdout.write(f"\n=== 사용 가능한 노래 목록 ===\n{lines}\n")
 
 def interactive_quiz_creation(all_songs: List[Dict]) -> Dict[str, Any]:
     """대화형 퀴즈 생성"""
@@ -177,15 +222,23 @@ def interactive_quiz_creation(all_songs: List[Dict]) -> Dict[str, Any]:
     print(f"\n노래 선택 (번호를 쉼표로 구분, 예: 1,3,5):")
     song_input = input("선택할 노래 번호들: ").strip()
     
-    try:
-        song_indices = [int(x.strip()) - 1 for x in song_input.split(',') if x.strip()]
-        selected_songs = [all_songs[i] for i in song_indices if 0 <= i < len(all_songs)]
-        
-        if not selected_songs:
-            print("유효한 노래가 선택되지 않았습니다. 모든 노래를 사용합니다.")
-            selected_songs = all_songs
-    except (ValueError, IndexError):
-        print("잘못된 입력입니다. 모든 노래를 사용합니다.")
+    # 번호 변환과 범위 확인을 한 번의 순회로 처리 (잘못된 번호는 건너뜀)
+    song_count = len(all_songs)
+    selected_songs = []
+    for token in song_input.split(','):
+        token = token.strip()
+        if not token:
+            continue
+        try:
+            index = int(token) - 1
+        except ValueError:
+            print(f"잘못된 번호 '{token}'는 건너뜁니다.")
+            continue
+        if 0 <= index < song_count:
+            selected_songs.append(all_songs[index])
+    
+    if not selected_songs:
+        print("유효한 노래가 선택되지 않았습니다. 모든 노래를 사용합니다.")
         selected_songs = all_songs
     
     # 문제 수 결정
@@ -194,7 +247,7 @@ def interactive_quiz_creation(all_songs: List[Dict]) -> Dict[str, Any]:
     
     question_input = input(f"문제 수 (최대 {max_questions}, 기본 {question_count}): ").strip()
     try:
-        question_count = min(int(question_input), max_questions)
+        question_count = max(1, min(int(question_input), max_questions))
     except ValueError:
         pass
     
@@ -230,8 +283,8 @@ def main():
         sys.exit(1)
     
     # 게임 추가 및 저장
-    data['games'].append(new_game)
-    data['created'] = datetime.now().isoformat() + 'Z'
+    add_game(data, new_game)
+    data['created'] = utc_now_iso()
     save_quiz_data(data)
     
     print(f"\n✅ 퀴즈 생성 완료!")
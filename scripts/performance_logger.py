@@ -5,14 +5,55 @@ WhatsThatTune 클립 처리 과정의 단계별 성능을 추적하고 로깅합
 """
 
 import json
+import sys
 import time
-import threading
-from datetime import datetime
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-from contextlib import contextmanager
+from typing import Callable, Dict, List, Any, Optional
+from dataclasses import dataclass, field
+from contextlib import contextmanager, nullcontext
 
-@dataclass
+try:
+    import orjson  # 선택 사항: 설치되어 있으면 더 빠른 JSON 직렬화 사용
+except ImportError:
+    orjson = None
+
+# 초 단위로 바뀌는 타임스탬프 앞부분 캐시 (초, "YYYY-MM-DDTHH:MM:SS")
+_timestamp_prefix = (-1, "")
+
+def format_timestamp(timestamp: Optional[float] = None) -> str:
+    """ISO 8601 형식 로컬 시각 문자열 (같은 초 안에서는 앞부분을 재사용하여 datetime 객체를 만들지 않음)"""
+    global _timestamp_prefix
+    if timestamp is None:
+        timestamp = time.time()
+    second = int(timestamp)
+    cached_second, prefix = _timestamp_prefix
+    if cached_second != second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _timestamp_prefix = (second, prefix)
+    return f"{prefix}.{int((timestamp - second) * 1e6):06d}"
+
+def dumps_progress(progress_info: Dict[str, Any]) -> str:
+    """PROGRESS 한 줄용 JSON 직렬화 (orjson이 있으면 사용)"""
+    if orjson is not None:
+        return orjson.dumps(progress_info).decode('utf-8')
+    return json.dumps(progress_info, ensure_ascii=False)
+
+# 단계 타입별 느린 단계 판정 기준 (초)
+SLOW_THRESHOLDS = {
+    "download": 30.0,  # 30초
+    "clip_generation": 5.0,  # 5초
+    "metadata_extraction": 1.0,  # 1초
+    "database_save": 2.0,  # 2초
+    "file_cleanup": 1.0  # 1초
+}
+DEFAULT_SLOW_THRESHOLD = 5.0  # 기준이 없는 단계 타입의 느린 단계 판정 기준 (초)
+FAILURE_RATE_THRESHOLD = 0.2  # 높은 실패율로 판정하는 실패 비율 (20%)
+
+def write_progress(progress_info: Dict[str, Any]):
+    """PROGRESS 줄을 stdout 버퍼에 기록 (줄마다 flush하지 않음, 타임스탬프는 출력 시점에 설정)"""
+    progress_info["timestamp"] = format_timestamp()
+    sys.stdout.write(f"PROGRESS: {dumps_progress(progress_info)}\n")
+
+@dataclass(slots=True)
 class StepPerformance:
     """단계별 성능 데이터"""
     step_name: str
@@ -24,8 +65,9 @@ class StepPerformance:
     success: bool = False
     error_message: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
+    start_monotonic: float = 0.0  # 소요 시간 계산 전용 (벽시계가 바뀌어도 음수가 되지 않도록)
 
-@dataclass
+@dataclass(slots=True)
 class SessionPerformance:
     """세션별 성능 데이터"""
     session_id: str
@@ -33,42 +75,41 @@ class SessionPerformance:
     start_time: float
     end_time: Optional[float] = None
     total_duration: Optional[float] = None
-    steps: List[StepPerformance] = None
+    steps: List[StepPerformance] = field(default_factory=list)
     summary: Optional[Dict[str, Any]] = None
-    
-    def __post_init__(self):
-        if self.steps is None:
-            self.steps = []
 
 class PerformanceLogger:
     """성능 로깅 클래스"""
     
-    def __init__(self, session_id: str, user_id: str = "unknown"):
+    def __init__(self, session_id: str, user_id: str = "unknown", output: Optional[Callable[[Dict[str, Any]], None]] = None):
         self.session_id = session_id
         self.user_id = user_id
+        # 진행률 출력 함수 (호출 측의 출력 스레드로 넘기면 작업 스레드가 stdout을 기다리지 않음)
+        self.output = output or write_progress
         self.session = SessionPerformance(
             session_id=session_id,
             user_id=user_id,
             start_time=time.time()
         )
+        # 단계 ID마다 한 스레드만 접근하고 dict 설정/pop과 list.append는 각각 원자적이므로 잠금 없이 사용
         self.active_steps: Dict[str, StepPerformance] = {}
-        self.lock = threading.Lock()
         
     def start_step(self, step_name: str, step_type: str, song_title: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """단계 시작"""
-        step_id = f"{step_name}_{song_title}_{int(time.time() * 1000)}"
+        start_time = time.time()
+        step_id = f"{step_name}_{song_title}_{int(start_time * 1000)}"
         
         step = StepPerformance(
             step_name=step_name,
             step_type=step_type,
             song_title=song_title,
-            start_time=time.time(),
-            metadata=metadata or {}
+            start_time=start_time,
+            metadata=metadata,
+            start_monotonic=time.monotonic()
         )
         
-        with self.lock:
-            self.active_steps[step_id] = step
-            
+        self.active_steps[step_id] = step
+        
         # 진행률 정보 출력
         self._output_step_progress("started", step_name, step_type, song_title, metadata)
         
@@ -76,21 +117,24 @@ class PerformanceLogger:
     
     def end_step(self, step_id: str, success: bool = True, error_message: Optional[str] = None, metadata: Optional[Dict[str, Any]] = None) -> Optional[float]:
         """단계 종료"""
-        with self.lock:
-            if step_id not in self.active_steps:
-                print(f"Warning: Step {step_id} not found in active steps")
-                return None
-                
-            step = self.active_steps.pop(step_id)
-            step.end_time = time.time()
-            step.duration = step.end_time - step.start_time
-            step.success = success
-            step.error_message = error_message
-            
-            if metadata:
+        step = self.active_steps.pop(step_id, None)
+        if step is None:
+            print(f"Warning: Step {step_id} not found in active steps")
+            return None
+        
+        step.end_time = time.time()
+        step.duration = time.monotonic() - step.start_monotonic
+        step.success = success
+        step.error_message = error_message
+        
+        if metadata:
+            # 메타데이터가 없는 단계가 대부분이므로 필요할 때만 합침
+            if step.metadata is None:
+                step.metadata = metadata
+            else:
                 step.metadata.update(metadata)
-                
-            self.session.steps.append(step)
+        
+        self.session.steps.append(step)
         
         # 진행률 정보 출력
         status = "completed" if success else "failed"
@@ -127,12 +171,12 @@ class PerformanceLogger:
             "step_type": step_type,
             "song_title": song_title,
             "session_id": self.session_id,
-            "user_id": self.user_id,
-            "timestamp": datetime.now().isoformat(),
-            **(metadata or {})
+            "user_id": self.user_id
         }
+        if metadata:
+            progress_info.update(metadata)
         
-        print(f"PROGRESS: {json.dumps(progress_info, ensure_ascii=False)}")
+        self.output(progress_info)
     
     def end_session(self) -> SessionPerformance:
         """세션 종료 및 요약 생성"""
@@ -149,11 +193,10 @@ class PerformanceLogger:
             "session_id": self.session_id,
             "user_id": self.user_id,
             "total_duration": self.session.total_duration,
-            "summary": self.session.summary,
-            "timestamp": datetime.now().isoformat()
+            "summary": self.session.summary
         }
         
-        print(f"PROGRESS: {json.dumps(session_info, ensure_ascii=False)}")
+        self.output(session_info)
         
         return self.session
     
@@ -171,10 +214,9 @@ class PerformanceLogger:
                 "step_type_breakdown": {}
             }
         
-        successful_steps = [s for s in steps if s.success]
-        failed_steps = [s for s in steps if not s.success]
-        
-        # 단계 타입별 분석
+        # 성공 수, 전체 소요 시간, 단계 타입별 분석을 한 번의 순회로 계산
+        successful_count = 0
+        total_processing_time = 0
         step_type_breakdown = {}
         for step in steps:
             if step.step_type not in step_type_breakdown:
@@ -191,8 +233,10 @@ class PerformanceLogger:
             breakdown = step_type_breakdown[step.step_type]
             breakdown["count"] += 1
             breakdown["total_duration"] += step.duration or 0
+            total_processing_time += step.duration or 0
             
             if step.success:
+                successful_count += 1
                 breakdown["successful"] += 1
             else:
                 breakdown["failed"] += 1
@@ -208,23 +252,15 @@ class PerformanceLogger:
             if breakdown["min_duration"] == float('inf'):
                 breakdown["min_duration"] = 0
         
-        total_processing_time = sum(s.duration or 0 for s in steps)
-        average_step_time = total_processing_time / len(steps) if steps else 0
+        failed_count = len(steps) - successful_count
+        average_step_time = total_processing_time / len(steps)
         
         # 성능 이슈 감지
         performance_issues = []
         
         # 느린 단계 감지
-        slow_thresholds = {
-            "download": 30.0,  # 30초
-            "clip_generation": 5.0,  # 5초
-            "metadata_extraction": 1.0,  # 1초
-            "database_save": 2.0,  # 2초
-            "file_cleanup": 1.0  # 1초
-        }
-        
         for step_type, breakdown in step_type_breakdown.items():
-            threshold = slow_thresholds.get(step_type, 5.0)
+            threshold = SLOW_THRESHOLDS.get(step_type, DEFAULT_SLOW_THRESHOLD)
             if breakdown["average_duration"] > threshold:
                 performance_issues.append({
                     "type": "slow_operation",
@@ -235,20 +271,20 @@ class PerformanceLogger:
                 })
         
         # 높은 실패율 감지
-        failure_rate = len(failed_steps) / len(steps) if steps else 0
-        if failure_rate > 0.2:  # 20% 이상 실패
+        failure_rate = failed_count / len(steps)
+        if failure_rate > FAILURE_RATE_THRESHOLD:
             performance_issues.append({
                 "type": "high_failure_rate",
                 "failure_rate": failure_rate,
-                "failed_steps": len(failed_steps),
+                "failed_steps": failed_count,
                 "total_steps": len(steps)
             })
         
         return {
             "total_steps": len(steps),
-            "successful_steps": len(successful_steps),
-            "failed_steps": len(failed_steps),
-            "success_rate": len(successful_steps) / len(steps) if steps else 0,
+            "successful_steps": successful_count,
+            "failed_steps": failed_count,
+            "success_rate": successful_count / len(steps),
             "failure_rate": failure_rate,
             "average_step_time": average_step_time,
             "total_processing_time": total_processing_time,
@@ -260,6 +296,7 @@ class PerformanceLogger:
         """현재 세션 통계 조회"""
         completed_steps = self.session.steps
         active_steps = len(self.active_steps)
+        successful_steps = sum(1 for s in completed_steps if s.success)
         
         return {
             "session_id": self.session_id,
@@ -267,17 +304,17 @@ class PerformanceLogger:
             "session_duration": time.time() - self.session.start_time,
             "completed_steps": len(completed_steps),
             "active_steps": active_steps,
-            "successful_steps": len([s for s in completed_steps if s.success]),
-            "failed_steps": len([s for s in completed_steps if not s.success])
+            "successful_steps": successful_steps,
+            "failed_steps": len(completed_steps) - successful_steps
         }
 
 # 전역 성능 로거 인스턴스
 _performance_logger: Optional[PerformanceLogger] = None
 
-def init_performance_logger(session_id: str, user_id: str = "unknown") -> PerformanceLogger:
+def init_performance_logger(session_id: str, user_id: str = "unknown", output: Optional[Callable[[Dict[str, Any]], None]] = None) -> PerformanceLogger:
     """성능 로거 초기화"""
     global _performance_logger
-    _performance_logger = PerformanceLogger(session_id, user_id)
+    _performance_logger = PerformanceLogger(session_id, user_id, output)
     return _performance_logger
 
 def get_performance_logger() -> Optional[PerformanceLogger]:
@@ -289,9 +326,10 @@ def log_step_performance(step_name: str, step_type: str, song_title: str, durati
     if _performance_logger:
         step_id = _performance_logger.start_step(step_name, step_type, song_title, metadata)
         # 시작 시간을 조정하여 duration을 맞춤
-        with _performance_logger.lock:
-            if step_id in _performance_logger.active_steps:
-                _performance_logger.active_steps[step_id].start_time = time.time() - duration
+        step = _performance_logger.active_steps.get(step_id)
+        if step is not None:
+            step.start_time -= duration
+            step.start_monotonic -= duration
         _performance_logger.end_step(step_id, success, error_message, metadata)
 
 def finalize_performance_logging() -> Optional[SessionPerformance]:
@@ -309,7 +347,6 @@ def time_step(step_name: str, step_type: str, song_title: str, metadata: Optiona
     if _performance_logger:
         return _performance_logger.step_timer(step_name, step_type, song_title, metadata)
     else:
-        from contextlib import nullcontext
         return nullcontext()
 
 def start_step_timing(step_name: str, step_type: str, song_title: str, metadata: Optional[Dict[str, Any]] = None) -> Optional[str]: